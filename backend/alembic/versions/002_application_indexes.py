@@ -0,0 +1,37 @@
+"""Add composite and partial indexes on applications
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_applications_program_status',
+        'applications',
+        ['program_id', 'processing_status']
+    )
+    op.create_index(
+        'ix_applications_pending_pickup',
+        'applications',
+        ['program_id'],
+        postgresql_where=sa.text("processing_status = 'pending' AND is_submitted = true")
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_pending_pickup', table_name='applications')
+    op.drop_index('ix_applications_program_status', table_name='applications')
@@ -0,0 +1,53 @@
+"""Store guideline criteria and calibration answers as JSONB
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 09:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'ai_guidelines', 'criteria',
+        type_=postgresql.JSONB(),
+        postgresql_using='criteria::jsonb'
+    )
+    op.alter_column(
+        'calibration_answers', 'answer_value',
+        type_=postgresql.JSONB(),
+        postgresql_using='answer_value::jsonb'
+    )
+    op.create_index(
+        'ix_ai_guidelines_criteria_gin',
+        'ai_guidelines',
+        ['criteria'],
+        postgresql_using='gin',
+        postgresql_ops={'criteria': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ai_guidelines_criteria_gin', table_name='ai_guidelines')
+    op.alter_column(
+        'calibration_answers', 'answer_value',
+        type_=sa.JSON(),
+        postgresql_using='answer_value::json'
+    )
+    op.alter_column(
+        'ai_guidelines', 'criteria',
+        type_=sa.JSON(),
+        postgresql_using='criteria::json'
+    )
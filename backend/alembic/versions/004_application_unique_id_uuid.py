@@ -0,0 +1,35 @@
+"""Store application unique_id as native UUID
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column(
+        'applications', 'unique_id',
+        type_=postgresql.UUID(as_uuid=True),
+        postgresql_using='unique_id::uuid'
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'applications', 'unique_id',
+        type_=sa.String(length=255),
+        postgresql_using='unique_id::text'
+    )
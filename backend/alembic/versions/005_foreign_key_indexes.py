@@ -0,0 +1,62 @@
+"""Add indexes on foreign keys and hot lookup columns
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Single-column foreign key indexes
+    op.create_index('ix_programs_organization_id', 'programs', ['organization_id'])
+    op.create_index('ix_questionnaires_program_id', 'questionnaires', ['program_id'])
+    op.create_index('ix_ai_guidelines_program_id', 'ai_guidelines', ['program_id'])
+    op.create_index('ix_applications_questionnaire_id', 'applications', ['questionnaire_id'])
+    op.create_index('ix_responses_question_id', 'responses', ['question_id'])
+    op.create_index('ix_uploaded_files_application_id', 'uploaded_files', ['application_id'])
+
+    # Composite indexes matching per-application and per-questionnaire lookups
+    op.create_index('ix_responses_application_question', 'responses', ['application_id', 'question_id'])
+    op.create_index('ix_scores_application_category', 'scores', ['application_id', 'category'])
+    op.create_index('ix_reports_application_latest', 'reports', ['application_id', 'is_latest'])
+    op.create_index(
+        'ix_reports_latest_only',
+        'reports',
+        ['application_id'],
+        postgresql_where=sa.text('is_latest')
+    )
+    op.create_index(
+        'ix_calibration_answers_program_question_key',
+        'calibration_answers',
+        ['program_id', 'question_key'],
+        unique=True
+    )
+    op.create_index('ix_questions_questionnaire_order', 'questions', ['questionnaire_id', 'order_index'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_questions_questionnaire_order', table_name='questions')
+    op.drop_index('ix_calibration_answers_program_question_key', table_name='calibration_answers')
+    op.drop_index('ix_reports_latest_only', table_name='reports')
+    op.drop_index('ix_reports_application_latest', table_name='reports')
+    op.drop_index('ix_scores_application_category', table_name='scores')
+    op.drop_index('ix_responses_application_question', table_name='responses')
+
+    op.drop_index('ix_uploaded_files_application_id', table_name='uploaded_files')
+    op.drop_index('ix_responses_question_id', table_name='responses')
+    op.drop_index('ix_applications_questionnaire_id', table_name='applications')
+    op.drop_index('ix_ai_guidelines_program_id', table_name='ai_guidelines')
+    op.drop_index('ix_questionnaires_program_id', table_name='questionnaires')
+    op.drop_index('ix_programs_organization_id', table_name='programs')
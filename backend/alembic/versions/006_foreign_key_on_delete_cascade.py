@@ -0,0 +1,50 @@
+"""Recreate foreign keys with ON DELETE CASCADE
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 10:45:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, referenced table) for every foreign key created in 001
+FOREIGN_KEYS = (
+    ('programs', 'organization_id', 'organizations'),
+    ('questionnaires', 'program_id', 'programs'),
+    ('questions', 'questionnaire_id', 'questionnaires'),
+    ('calibration_answers', 'program_id', 'programs'),
+    ('ai_guidelines', 'program_id', 'programs'),
+    ('applications', 'program_id', 'programs'),
+    ('applications', 'questionnaire_id', 'questionnaires'),
+    ('responses', 'application_id', 'applications'),
+    ('responses', 'question_id', 'questions'),
+    ('uploaded_files', 'application_id', 'applications'),
+    ('reports', 'application_id', 'applications'),
+    ('scores', 'application_id', 'applications'),
+)
+
+
+def _recreate_foreign_keys(ondelete: Union[str, None]) -> None:
+    for table, column, referenced in FOREIGN_KEYS:
+        # PostgreSQL default name for the unnamed constraints from 001
+        name = f'{table}_{column}_fkey'
+        op.drop_constraint(name, table, type_='foreignkey')
+        op.create_foreign_key(name, table, referenced, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    _recreate_foreign_keys('CASCADE')
+
+
+def downgrade() -> None:
+    _recreate_foreign_keys(None)
@@ -0,0 +1,45 @@
+"""Denormalize latest report score onto applications
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('applications', sa.Column('overall_score', sa.Float(), nullable=True))
+    op.add_column('applications', sa.Column('latest_report_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_applications_latest_report_id',
+        'applications', 'reports',
+        ['latest_report_id'], ['id'],
+        ondelete='SET NULL'
+    )
+    op.create_index('ix_applications_program_score', 'applications', ['program_id', 'overall_score'])
+
+    # Backfill from existing latest reports
+    op.execute("""
+        UPDATE applications AS a
+        SET overall_score = r.overall_score, latest_report_id = r.id
+        FROM reports AS r
+        WHERE r.application_id = a.id AND r.is_latest
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_applications_program_score', table_name='applications')
+    op.drop_constraint('fk_applications_latest_report_id', 'applications', type_='foreignkey')
+    op.drop_column('applications', 'latest_report_id')
+    op.drop_column('applications', 'overall_score')
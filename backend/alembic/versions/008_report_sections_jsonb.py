@@ -0,0 +1,81 @@
+"""Consolidate report section columns into a JSONB document
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 11:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '008'
+down_revision: Union[str, None] = '007'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SECTIONS = (
+    'problem_solution',
+    'customer_profile',
+    'product_technology',
+    'team_structure',
+    'market_opportunity',
+    'financial_overview',
+    'key_challenges',
+    'validation_achievements',
+    'investigation_areas',
+)
+
+
+def upgrade() -> None:
+    op.add_column('reports', sa.Column('sections', postgresql.JSONB(), nullable=True))
+
+    # Backfill the document from the existing score/content column pairs
+    pairs = ', '.join(
+        f"'{section}', jsonb_build_object('score', {section}_score, 'content', {section}_content)"
+        for section in SECTIONS
+    )
+    op.execute(f"UPDATE reports SET sections = jsonb_build_object({pairs})")
+    op.alter_column('reports', 'sections', nullable=False)
+
+    # Replace the plain columns with generated ones read from the document
+    for section in SECTIONS:
+        op.drop_column('reports', f'{section}_content')
+        op.drop_column('reports', f'{section}_score')
+        op.add_column('reports', sa.Column(
+            f'{section}_score',
+            sa.Float(),
+            sa.Computed(f"CAST(sections -> '{section}' ->> 'score' AS FLOAT)", persisted=True)
+        ))
+
+    op.create_index('ix_reports_overall_score', 'reports', ['overall_score'])
+    op.create_index(
+        'ix_reports_sections_gin',
+        'reports',
+        ['sections'],
+        postgresql_using='gin',
+        postgresql_ops={'sections': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_reports_sections_gin', table_name='reports')
+    op.drop_index('ix_reports_overall_score', table_name='reports')
+
+    for section in SECTIONS:
+        op.drop_column('reports', f'{section}_score')
+        op.add_column('reports', sa.Column(f'{section}_score', sa.Float(), nullable=True))
+        op.add_column('reports', sa.Column(f'{section}_content', sa.Text(), nullable=True))
+        op.execute(
+            f"UPDATE reports SET "
+            f"{section}_score = CAST(sections -> '{section}' ->> 'score' AS FLOAT), "
+            f"{section}_content = sections -> '{section}' ->> 'content'"
+        )
+        op.alter_column('reports', f'{section}_score', nullable=False)
+        op.alter_column('reports', f'{section}_content', nullable=False)
+
+    op.drop_column('reports', 'sections')
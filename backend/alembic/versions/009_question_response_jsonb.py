@@ -0,0 +1,52 @@
+"""Store question options, validation rules and responses as JSONB
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+JSON_COLUMNS = (
+    ('questions', 'options'),
+    ('questions', 'validation_rules'),
+    ('responses', 'response_value'),
+)
+
+
+def upgrade() -> None:
+    for table, column in JSON_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb'
+        )
+    op.create_index(
+        'ix_responses_response_value_gin',
+        'responses',
+        ['response_value'],
+        postgresql_using='gin',
+        postgresql_ops={'response_value': 'jsonb_path_ops'}
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_responses_response_value_gin', table_name='responses')
+    for table, column in reversed(JSON_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json'
+        )
@@ -0,0 +1,50 @@
+"""Enforce a single latest report per application
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-15 12:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest latest report per application before adding the constraint
+    op.execute("""
+        UPDATE reports AS r
+        SET is_latest = false
+        WHERE r.is_latest AND EXISTS (
+            SELECT 1 FROM reports AS newer
+            WHERE newer.application_id = r.application_id
+              AND newer.is_latest
+              AND (newer.version, newer.id) > (r.version, r.id)
+        )
+    """)
+    op.drop_index('ix_reports_latest_only', table_name='reports')
+    op.create_index(
+        'uq_reports_latest_per_application',
+        'reports',
+        ['application_id'],
+        unique=True,
+        postgresql_where=sa.text('is_latest')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_reports_latest_per_application', table_name='reports')
+    op.create_index(
+        'ix_reports_latest_only',
+        'reports',
+        ['application_id'],
+        postgresql_where=sa.text('is_latest')
+    )
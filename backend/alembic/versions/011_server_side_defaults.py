@@ -0,0 +1,47 @@
+"""Move column defaults to the database
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-15 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+SERVER_DEFAULTS = (
+    ('organizations', 'is_active', 'true'),
+    ('programs', 'is_active', 'true'),
+    ('questionnaires', 'is_active', 'true'),
+    ('questions', 'is_required', 'true'),
+    ('applications', 'is_submitted', 'false'),
+    ('applications', 'is_processed', 'false'),
+    ('applications', 'processing_status', "'pending'"),
+    ('uploaded_files', 'extraction_status', "'pending'"),
+    ('scores', 'is_overridden', 'false'),
+    ('reports', 'generation_status', "'pending'"),
+    ('reports', 'version', '1'),
+    ('reports', 'is_latest', 'true'),
+    ('ai_guidelines', 'weight', '1'),
+    ('ai_guidelines', 'is_active', 'true'),
+    ('ai_guidelines', 'version', '1'),
+)
+
+
+def upgrade() -> None:
+    for table, column, default in SERVER_DEFAULTS:
+        op.alter_column(table, column, server_default=sa.text(default))
+
+
+def downgrade() -> None:
+    for table, column, _ in reversed(SERVER_DEFAULTS):
+        op.alter_column(table, column, server_default=None)
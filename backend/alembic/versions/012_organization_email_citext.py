@@ -0,0 +1,39 @@
+"""Store organization emails as case-insensitive CITEXT
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-15 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012'
+down_revision: Union[str, None] = '011'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    # Fails on existing emails that differ only in case; merge those accounts first
+    op.alter_column(
+        'organizations', 'email',
+        type_=postgresql.CITEXT(),
+        existing_type=sa.String(length=255),
+        existing_nullable=False
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'organizations', 'email',
+        type_=sa.String(length=255),
+        existing_type=postgresql.CITEXT(),
+        existing_nullable=False
+    )
@@ -0,0 +1,37 @@
+"""Index active and versioned guideline lookups
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '013'
+down_revision: Union[str, None] = '012'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_ai_guidelines_program_active',
+        'ai_guidelines',
+        ['program_id', 'section'],
+        postgresql_where=sa.text('is_active')
+    )
+    op.create_index(
+        'ix_ai_guidelines_program_version',
+        'ai_guidelines',
+        ['program_id', 'version']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ai_guidelines_program_version', table_name='ai_guidelines')
+    op.drop_index('ix_ai_guidelines_program_active', table_name='ai_guidelines')
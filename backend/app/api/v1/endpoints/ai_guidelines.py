@@ -9,6 +9,7 @@ from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_organization
 from app.api.deps.database import get_db
+from app.core.database import get_read_db
 from app.models.organization import Organization
 from app.schemas.ai_guidelines import (
     GenerateGuidelinesRequest,
@@ -107,7 +108,7 @@ def save_guidelines(
 @router.get("/active", response_model=Optional[SavedGuidelines])
 def get_active_guidelines(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_org: Organization = Depends(get_current_organization)
 ):
     """
@@ -133,6 +134,8 @@ def get_active_guidelines(
 @router.get("/history", response_model=GuidelinesListResponse)
 def get_guidelines_history(
     program_id: int,
+    # History streams rows through a server-side cursor, which needs a
+    # transaction; the autocommit read session cannot provide one
     db: Session = Depends(get_db),
     current_org: Organization = Depends(get_current_organization)
 ):
@@ -205,7 +208,7 @@ def activate_guidelines_version(
 @router.get("/status", response_model=GuidelinesStatusResponse)
 def get_guidelines_status(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_org: Organization = Depends(get_current_organization)
 ):
     """
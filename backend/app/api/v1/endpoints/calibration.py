@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_organization
 from app.api.deps.organization import get_organization_program
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.organization import Organization
 from app.models.program import Program
 from app.services.calibration_service import CalibrationService
@@ -35,7 +35,7 @@ async def get_calibration_questions(
 @router.get("/programs/{program_id}/status", response_model=CalibrationCompletionStatus)
 async def get_calibration_status(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_org: Organization = Depends(get_current_organization)
 ):
     """
@@ -58,7 +58,7 @@ async def get_calibration_status(
 @router.get("/programs/{program_id}/answers", response_model=List[CalibrationAnswerResponse])
 async def get_program_calibration_answers(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_org: Organization = Depends(get_current_organization)
 ):
     """
@@ -81,7 +81,7 @@ async def get_program_calibration_answers(
 @router.get("/programs/{program_id}/session", response_model=CalibrationSessionResponse)
 async def get_calibration_session(
     program_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_org: Organization = Depends(get_current_organization)
 ):
     """
@@ -179,7 +179,7 @@ async def batch_create_or_update_answers(
 async def get_calibration_answer_by_key(
     program_id: int,
     question_key: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_org: Organization = Depends(get_current_organization)
 ):
     """
@@ -4,7 +4,7 @@ Provides REST API for program CRUD operations and management.
 """
 
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Response
 from sqlalchemy.orm import Session
 
 from app.api.deps.auth import get_current_organization
@@ -81,7 +81,8 @@ def get_programs(
                 detail=response.error
             )
         
-        return response
+        # Programs come from the database; encode straight to JSON bytes instead of re-validating
+        return Response(content=response.model_dump_json(), media_type="application/json")
         
     except HTTPException:
         raise
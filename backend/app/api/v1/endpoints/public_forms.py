@@ -1,12 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from typing import List, Optional
+from uuid import UUID
 
 from app.api.deps.database import get_db
 from app.models.application import Application
 from app.models.program import Program
 from app.models.questionnaire import Questionnaire
-from app.models.question import Question
 from app.schemas.question import QuestionResponse
 
 router = APIRouter()
@@ -19,6 +19,17 @@ class PublicQuestionnaireResponse:
         self.program_name = questionnaire_data['program_name']
         self.questions = questionnaire_data['questions']
 
+def _get_application_by_unique_id(db: Session, unique_id: str) -> Optional[Application]:
+    """Look up an application by its public ID; malformed IDs are treated as not found"""
+    try:
+        application_uuid = UUID(unique_id)
+    except ValueError:
+        return None
+    
+    return db.query(Application).filter(
+        Application.unique_id == application_uuid
+    ).first()
+
 @router.get("/applications/{unique_id}/questionnaire")
 def get_public_questionnaire(
     unique_id: str,
@@ -30,9 +41,7 @@ def get_public_questionnaire(
     Used by startup applicants to fill out their application form
     """
     # Get application with unique ID
-    application = db.query(Application).filter(
-        Application.unique_id == unique_id
-    ).first()
+    application = _get_application_by_unique_id(db, unique_id)
     
     if not application:
         raise HTTPException(
@@ -65,10 +74,8 @@ def get_public_questionnaire(
             detail="Questionnaire not found or inactive"
         )
     
-    # Get questions ordered by order_index
-    questions = db.query(Question).filter(
-        Question.questionnaire_id == questionnaire.id
-    ).order_by(Question.order_index).all()
+    # Questions are selectin-loaded with the questionnaire, ordered by order_index
+    questions = questionnaire.questions
     
     # Convert questions to dictionaries
     questions_data = []
@@ -117,9 +124,7 @@ def get_application_status(
     Get application status (public endpoint)
     Used to show application status to startups
     """
-    application = db.query(Application).filter(
-        Application.unique_id == unique_id
-    ).first()
+    application = _get_application_by_unique_id(db, unique_id)
     
     if not application:
         raise HTTPException(
@@ -1,5 +1,5 @@
 from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Response
 from sqlalchemy.orm import Session
 from sqlalchemy import and_
 
@@ -14,8 +14,7 @@ from app.schemas.question import (
     QuestionUpdate,
     QuestionResponse,
     QuestionListResponse,
-    QuestionReorderRequest,
-    QuestionType
+    QuestionReorderRequest
 )
 from app.schemas.questionnaire import (
     QuestionnaireCreate,
@@ -54,16 +53,16 @@ def get_questions(
             detail="Questionnaire not found"
         )
     
-    # Get questions ordered by order_index
-    questions = db.query(Question).filter(
-        Question.questionnaire_id == questionnaire_id
-    ).order_by(Question.order_index).all()
+    # Questions are selectin-loaded with the questionnaire, ordered by order_index
+    questions = questionnaire.questions
     
-    return QuestionListResponse(
-        questions=questions,
+    # Questions come from the database; encode straight to JSON bytes instead of re-validating
+    response = QuestionListResponse.model_construct(
+        questions=[QuestionResponse.from_row(q) for q in questions],
         total=len(questions),
         questionnaire_id=questionnaire_id
     )
+    return Response(content=response.model_dump_json(), media_type="application/json")
 
 
 @router.post("/questionnaires/{questionnaire_id}/questions", response_model=QuestionResponse)
@@ -132,34 +131,30 @@ def create_question(
                 Question.order_index: Question.order_index + 1
             })
     
+    # Store options as sent by the client; the discriminator is schema-only
+    options = question.options.model_dump(exclude_unset=True, exclude={"kind"}) if question.options else None
+    validation_rules = question.validation_rules.model_dump(exclude_unset=True) if question.validation_rules else None
+    
     # Create question
     db_question = Question(
         text=question.text,
-        question_type=question.question_type.value,
+        question_type=question.question_type,
         is_required=question.is_required,
         order_index=question.order_index,
-        options=question.options if question.options else None,
-        validation_rules=question.validation_rules if question.validation_rules else None,
+        options=options or None,
+        validation_rules=validation_rules or None,
         questionnaire_id=questionnaire_id
     )
     
+    # The INSERT's RETURNING fills id and timestamps on flush, so the
+    # response is built before commit expires the instance (no refresh SELECT)
     db.add(db_question)
+    db.flush()
+    # Rows come from the database, so skip re-validation
+    response = QuestionResponse.from_row(db_question)
     db.commit()
-    db.refresh(db_question)
     
-    # Create proper response object
-    return QuestionResponse(
-        id=db_question.id,
-        text=db_question.text,
-        question_type=QuestionType(db_question.question_type),
-        is_required=db_question.is_required,
-        order_index=db_question.order_index,
-        options=db_question.options or {},
-        validation_rules=db_question.validation_rules or {},
-        questionnaire_id=db_question.questionnaire_id,
-        created_at=db_question.created_at.isoformat() if db_question.created_at else "",
-        updated_at=db_question.updated_at.isoformat() if db_question.updated_at else ""
-    )
+    return response
 
 
 @router.get("/questions/{question_id}", response_model=QuestionResponse)
@@ -189,19 +184,8 @@ def get_question(
             detail="Question not found"
         )
     
-    # Create proper response object
-    return QuestionResponse(
-        id=question.id,
-        text=question.text,
-        question_type=QuestionType(question.question_type),
-        is_required=question.is_required,
-        order_index=question.order_index,
-        options=question.options or {},
-        validation_rules=question.validation_rules or {},
-        questionnaire_id=question.questionnaire_id,
-        created_at=question.created_at.isoformat() if question.created_at else "",
-        updated_at=question.updated_at.isoformat() if question.updated_at else ""
-    )
+    # Rows come from the database, so skip re-validation
+    return QuestionResponse.from_row(question)
 
 
 @router.put("/questions/{question_id}", response_model=QuestionResponse)
@@ -269,34 +253,17 @@ def update_question(
             })
     
     # Update question fields
-    update_data = question_update.dict(exclude_unset=True)
+    # The options discriminator is schema-only and is not persisted
+    update_data = question_update.model_dump(exclude_unset=True, exclude={"options": {"kind"}})
     
     for field, value in update_data.items():
-        if field == "options" and value is not None:
-            setattr(db_question, field, value)
-        elif field == "validation_rules" and value is not None:
-            setattr(db_question, field, value)
-        elif field == "question_type" and value is not None:
-            setattr(db_question, field, value.value)
-        else:
-            setattr(db_question, field, value)
+        setattr(db_question, field, value)
     
     db.commit()
     db.refresh(db_question)
     
-    # Create proper response object
-    return QuestionResponse(
-        id=db_question.id,
-        text=db_question.text,
-        question_type=QuestionType(db_question.question_type),
-        is_required=db_question.is_required,
-        order_index=db_question.order_index,
-        options=db_question.options or {},
-        validation_rules=db_question.validation_rules or {},
-        questionnaire_id=db_question.questionnaire_id,
-        created_at=db_question.created_at.isoformat() if db_question.created_at else "",
-        updated_at=db_question.updated_at.isoformat() if db_question.updated_at else ""
-    )
+    # Rows come from the database, so skip re-validation
+    return QuestionResponse.from_row(db_question)
 
 
 @router.delete("/questions/{question_id}")
@@ -419,23 +386,19 @@ def get_program_questionnaires(
             detail="Program not found"
         )
     
-    questionnaires = QuestionnaireService.get_questionnaires_by_program(
+    rows = QuestionnaireService.get_questionnaires_with_question_counts(
         db=db,
         program_id=program_id,
         organization_id=current_org.id,
         include_inactive=include_inactive
     )
     
-    # Add question count to each questionnaire
-    for questionnaire in questionnaires:
-        question_count = db.query(Question).filter(
-            Question.questionnaire_id == questionnaire.id
-        ).count()
-        questionnaire.question_count = question_count
-    
-    return QuestionnaireListResponse(
-        questionnaires=questionnaires,
-        total_count=len(questionnaires)
+    return QuestionnaireListResponse.model_construct(
+        questionnaires=[
+            QuestionnaireResponse.from_row(questionnaire, question_count)
+            for questionnaire, question_count in rows
+        ],
+        total_count=len(rows)
     )
 
 
@@ -462,8 +425,8 @@ def create_questionnaire(
         organization_id=current_org.id
     )
     
-    questionnaire.question_count = 0  # New questionnaire has no questions
-    return questionnaire
+    # New questionnaire has no questions
+    return QuestionnaireResponse.from_row(questionnaire, 0)
 
 
 @router.get("/questionnaires/{questionnaire_id}", response_model=QuestionnaireDetailResponse)
@@ -485,8 +448,8 @@ def get_questionnaire(
             detail="Questionnaire not found"
         )
     
-    # Create Pydantic model from dict
-    return QuestionnaireDetailResponse(**questionnaire_data)
+    # Dict is built from database rows, so skip re-validation
+    return QuestionnaireDetailResponse.model_construct(**questionnaire_data)
 
 
 @router.put("/questionnaires/{questionnaire_id}", response_model=QuestionnaireResponse)
@@ -519,9 +482,8 @@ def update_questionnaire(
     question_count = db.query(Question).filter(
         Question.questionnaire_id == questionnaire_id
     ).count()
-    updated_questionnaire.question_count = question_count
     
-    return updated_questionnaire
+    return QuestionnaireResponse.from_row(updated_questionnaire, question_count)
 
 
 @router.delete("/questionnaires/{questionnaire_id}")
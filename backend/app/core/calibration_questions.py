@@ -1,6 +1,8 @@
 # Calibration Questions for Accelerator Preferences
 # These questions help the AI understand what each accelerator values most in startup applications
 
+from functools import lru_cache
+
 CALIBRATION_QUESTIONS = [
     {
         "key": "team_importance",
@@ -143,6 +145,15 @@ CALIBRATION_QUESTIONS = [
     }
 ]
 
+# The question set is static, so key lookups are built once at import
+QUESTIONS_BY_KEY = {question["key"]: question for question in CALIBRATION_QUESTIONS}
+ALL_QUESTION_KEYS = frozenset(QUESTIONS_BY_KEY)
+VALID_CHOICES_BY_KEY = {
+    question["key"]: frozenset(option["value"] for option in question.get("options", []))
+    for question in CALIBRATION_QUESTIONS
+    if question["type"] == "multiple_choice"
+}
+
 # Categories for organizing the calibration process
 CALIBRATION_CATEGORIES = {
     "team_and_founders": {
@@ -174,10 +185,7 @@ CALIBRATION_CATEGORIES = {
 
 def get_question_by_key(question_key: str):
     """Get a specific calibration question by its key"""
-    for question in CALIBRATION_QUESTIONS:
-        if question["key"] == question_key:
-            return question
-    return None
+    return QUESTIONS_BY_KEY.get(question_key)
 
 def get_questions_by_category(category_key: str):
     """Get all questions for a specific category"""
@@ -194,6 +202,7 @@ def get_questions_by_category(category_key: str):
     
     return questions
 
+@lru_cache(maxsize=1)
 def get_all_questions_organized():
     """Get all questions organized by category"""
     organized = {}
@@ -1,19 +1,70 @@
+import orjson
+from fastapi import Depends
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 from .config import settings
+from app.models import Base, load_all_models
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
-    pool_pre_ping=True,
-    pool_size=20,
-    max_overflow=0,
-    echo=settings.DEBUG  # Enable SQL query logging in debug mode
-)
+# Register all models with the metadata once, before any mapper is used
+load_all_models()
+
+
+def _json_serializer(value) -> str:
+    """Encode JSON/JSONB column values with orjson (non-str keys coerced like json.dumps)."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _create_engine(url: str):
+    """
+    Create an engine with a persistent connection pool, so requests reuse
+    connections instead of paying the connect + auth handshake each time.
+    """
+    # psycopg2 sends executemany() one statement at a time; batch it so multi-row
+    # writes (e.g. one guideline row per category) ship in a single round trip
+    dialect_options = {}
+    if make_url(url).get_driver_name() == "psycopg2":
+        dialect_options = dict(
+            executemany_mode="values_plus_batch",
+            insertmanyvalues_page_size=1000,
+            executemany_batch_page_size=500
+        )
+    
+    return create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+        json_serializer=_json_serializer,
+        json_deserializer=orjson.loads,
+        **dialect_options
+    )
+
+
+engine = _create_engine(settings.DATABASE_URL)
 
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Read-only endpoints run on the replica when one is configured. Its sessions use
+# AUTOCOMMIT connections, so plain SELECTs skip the BEGIN/COMMIT pair
+ReadSessionLocal = None
+if settings.DATABASE_READONLY_URL:
+    read_engine = _create_engine(settings.DATABASE_READONLY_URL)
+    _read_options = {"isolation_level": "AUTOCOMMIT"}
+    if read_engine.dialect.name == "postgresql":
+        _read_options["postgresql_readonly"] = True
+    ReadSessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=read_engine.execution_options(**_read_options)
+    )
+
 # Database dependency for FastAPI
 def get_db():
     """
@@ -26,18 +77,28 @@ def get_db():
     finally:
         db.close()
 
+def get_read_db(db: Session = Depends(get_db)):
+    """
+    Database dependency for read-only endpoints.
+    Yields an autocommit, read-only session on the replica when
+    DATABASE_READONLY_URL is set; otherwise reuses the request's primary
+    session so a read request holds a single pooled connection.
+    """
+    if ReadSessionLocal is None:
+        yield db
+        return
+    read_db = ReadSessionLocal()
+    try:
+        yield read_db
+    finally:
+        read_db.close()
+
 # Helper function to create all tables
 def create_tables():
     """Create all tables in the database"""
-    from app.models.base import Base
-    # Import all models to ensure they're registered with the metadata
-    import app.models
     Base.metadata.create_all(bind=engine)
 
 # Helper function to drop all tables
 def drop_tables():
     """Drop all tables from the database"""
-    from app.models.base import Base
-    # Import all models to ensure they're registered with the metadata
-    import app.models
     Base.metadata.drop_all(bind=engine)
\ No newline at end of file
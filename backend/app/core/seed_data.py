@@ -4,10 +4,11 @@ Seed data for testing and development
 from sqlalchemy.orm import Session
 from app.models import *
 from app.core.database import SessionLocal
-from passlib.context import CryptContext
 import uuid
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Precomputed bcrypt hash of the seed password "admin123" (12 rounds).
+# Hashing at seed time costs ~100ms of CPU per run for a value that never changes.
+SEED_ADMIN_PASSWORD_HASH = "$2b$12$yCNdQyT7AJLw5sV15D.BaubkJqrd51yg1l2GseRf28c8i6HluMQnm"
 
 def create_seed_data():
     """Create initial seed data for development and testing"""
@@ -18,7 +19,7 @@ def create_seed_data():
         org = Organization(
             name="TechEd Accelerator",
             email="admin@teched-accelerator.com",
-            password_hash=pwd_context.hash("admin123"),
+            password_hash=SEED_ADMIN_PASSWORD_HASH,
             description="Leading technology accelerator focused on early-stage startups",
             website="https://teched-accelerator.com",
             is_active=True
@@ -193,7 +194,7 @@ def create_seed_data():
         
         # Create a sample application
         application = Application(
-            unique_id=str(uuid.uuid4()),
+            unique_id=uuid.uuid4(),
             startup_name="AI-Powered Analytics Co",
             contact_email="founder@aianalytics.com",
             is_submitted=False,
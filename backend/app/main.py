@@ -3,13 +3,14 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy import text
 
 from app.api.v1.api import api_router
 from app.core.config import settings
 from app.core.database import engine
+from app.services.openrouter_service import openrouter_service
 
 # Set up logging
 logging.basicConfig(
@@ -18,6 +19,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# SQL statement logging in debug mode (configured on the logger rather than
+# engine echo, so non-debug runs never format statements)
+logging.getLogger("sqlalchemy.engine").setLevel(
+    logging.INFO if settings.DEBUG else logging.WARNING
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -25,6 +32,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up VDP API...")
     yield
     logger.info("Shutting down VDP API...")
+    await openrouter_service.close()
 
 
 app = FastAPI(
@@ -32,6 +40,7 @@ app = FastAPI(
     version=settings.VERSION,
     description="VDP - Venture Development Platform API",
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -49,7 +58,7 @@ app.add_middleware(
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException):
     """Handle HTTP exceptions."""
-    logger.error(f"HTTP exception: {exc.status_code} - {exc.detail}")
+    logger.error("HTTP exception: %s - %s", exc.status_code, exc.detail)
     return JSONResponse(
         status_code=exc.status_code,
         content={"detail": exc.detail, "status_code": exc.status_code}
@@ -59,7 +68,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
     """Handle database exceptions."""
-    logger.error(f"Database error: {str(exc)}")
+    logger.error("Database error: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "status_code": 500}
@@ -69,7 +78,7 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions."""
-    logger.error(f"Unexpected error: {str(exc)}")
+    logger.error("Unexpected error: %s", exc)
     return JSONResponse(
         status_code=500,
         content={"detail": "Internal server error", "status_code": 500}
@@ -93,7 +102,7 @@ async def health_check():
         # Test database connection
         with engine.connect() as conn:
             conn.execute(text("SELECT 1"))
-        return {"status": "healthy", "database": "connected"}
+        return {"status": "healthy", "database": "connected", "pool": engine.pool.status()}
     except Exception as e:
-        logger.error(f"Health check failed: {str(e)}")
+        logger.error("Health check failed: %s", e)
         return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
\ No newline at end of file
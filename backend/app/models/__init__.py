@@ -1,15 +1,22 @@
+from importlib import import_module
+
 from .base import Base
-from .organization import Organization
-from .program import Program
-from .questionnaire import Questionnaire
-from .question import Question
-from .calibration_answer import CalibrationAnswer
-from .ai_guideline import AIGuideline
-from .application import Application
-from .response import Response
-from .uploaded_file import UploadedFile
-from .report import Report
-from .score import Score
+
+# Model classes are imported on first access (PEP 562), so code that only needs
+# Base or a single model doesn't import every mapper module up front.
+_LAZY_MODELS = {
+    "Organization": ".organization",
+    "Program": ".program",
+    "Questionnaire": ".questionnaire",
+    "Question": ".question",
+    "CalibrationAnswer": ".calibration_answer",
+    "AIGuideline": ".ai_guideline",
+    "Application": ".application",
+    "Response": ".response",
+    "UploadedFile": ".uploaded_file",
+    "Report": ".report",
+    "Score": ".score",
+}
 
 __all__ = [
     "Base",
@@ -24,4 +31,24 @@ __all__ = [
     "UploadedFile",
     "Report",
     "Score"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_MODELS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    model = getattr(import_module(module_name, __name__), name)
+    globals()[name] = model
+    return model
+
+
+def __dir__():
+    return __all__
+
+
+def load_all_models() -> None:
+    """Import every model so all tables and relationships are registered with Base"""
+    for name in _LAZY_MODELS:
+        __getattr__(name)
@@ -1,24 +1,39 @@
-from sqlalchemy import Column, String, Text, ForeignKey, JSON, Boolean, Integer
+from sqlalchemy import Column, String, Text, ForeignKey, Boolean, Integer, Index, text
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, JSONBType
 
 class AIGuideline(BaseModel):
     """Generated and user-modified AI scoring guidelines"""
     
     __tablename__ = "ai_guidelines"
+    _repr_attrs = ("section",)
+    __table_args__ = (
+        Index(
+            "ix_ai_guidelines_criteria_gin",
+            "criteria",
+            postgresql_using="gin",
+            postgresql_ops={"criteria": "jsonb_path_ops"}
+        ),
+        # Active version lookups, ordered by section, only ever touch active rows
+        Index(
+            "ix_ai_guidelines_program_active",
+            "program_id",
+            "section",
+            postgresql_where=text("is_active")
+        ),
+        # Version history and next-version lookups (scanned backwards for version DESC)
+        Index("ix_ai_guidelines_program_version", "program_id", "version"),
+    )
     
     section = Column(String(255), nullable=False)  # e.g., "team_structure", "market_opportunity"
-    weight = Column(Integer, default=1, nullable=False)  # Scoring weight (1-10)
-    criteria = Column(JSON, nullable=False)  # Detailed scoring criteria
+    weight = Column(Integer, server_default=text("1"), nullable=False)  # Scoring weight (1-10)
+    criteria = Column(JSONBType, nullable=False)  # Detailed scoring criteria
     prompt_template = Column(Text, nullable=False)  # AI prompt for this section
-    is_active = Column(Boolean, default=True, nullable=False)
-    version = Column(Integer, default=1, nullable=False)  # For versioning guidelines
+    is_active = Column(Boolean, server_default=text("true"), nullable=False)
+    version = Column(Integer, server_default=text("1"), nullable=False)  # For versioning guidelines
     
     # Foreign keys
-    program_id = Column(ForeignKey("programs.id"), nullable=False)
+    program_id = Column(ForeignKey("programs.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
-    program = relationship("Program", back_populates="ai_guidelines")
-    
-    def __repr__(self):
-        return f"<AIGuideline(id={self.id}, section='{self.section}')>"
\ No newline at end of file
+    program = relationship("Program", back_populates="ai_guidelines")
\ No newline at end of file
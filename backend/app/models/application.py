@@ -1,4 +1,6 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Boolean, DateTime
+import uuid
+
+from sqlalchemy import Column, String, Text, ForeignKey, Boolean, DateTime, Float, Index, Uuid, text
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -6,27 +8,45 @@ class Application(BaseModel):
     """Startup applications with unique IDs"""
     
     __tablename__ = "applications"
+    _repr_attrs = ("startup_name",)
+    __table_args__ = (
+        # Admin dashboards filter applications by program and processing status
+        Index("ix_applications_program_status", "program_id", "processing_status"),
+        # Worker pickup only ever looks at submitted, still-pending applications
+        Index(
+            "ix_applications_pending_pickup",
+            "program_id",
+            postgresql_where=text("processing_status = 'pending' AND is_submitted = true")
+        ),
+        # Program application lists sorted by score read straight from this table
+        Index("ix_applications_program_score", "program_id", "overall_score"),
+    )
     
-    unique_id = Column(String(255), nullable=False, unique=True, index=True)  # Non-guessable URL ID
+    unique_id = Column(Uuid, nullable=False, unique=True, index=True, default=uuid.uuid4)  # Non-guessable URL ID
     startup_name = Column(String(255), nullable=False)
     contact_email = Column(String(255), nullable=False)
-    is_submitted = Column(Boolean, default=False, nullable=False)
-    is_processed = Column(Boolean, default=False, nullable=False)
-    processing_status = Column(String(50), default="pending")  # pending, processing, completed, failed
+    is_submitted = Column(Boolean, server_default=text("false"), nullable=False)
+    is_processed = Column(Boolean, server_default=text("false"), nullable=False)
+    processing_status = Column(String(50), server_default=text("'pending'"))  # pending, processing, completed, failed
     submitted_at = Column(DateTime)
     processed_at = Column(DateTime)
     
+    # Denormalized from the latest report (kept in sync by a Report after_insert hook)
+    overall_score = Column(Float)  # 1-10 scale
+    latest_report_id = Column(
+        ForeignKey("reports.id", use_alter=True, name="fk_applications_latest_report_id", ondelete="SET NULL")
+    )
+    
     # Foreign keys
-    program_id = Column(ForeignKey("programs.id"), nullable=False)
-    questionnaire_id = Column(ForeignKey("questionnaires.id"), nullable=False)
+    program_id = Column(ForeignKey("programs.id", ondelete="CASCADE"), nullable=False)
+    questionnaire_id = Column(ForeignKey("questionnaires.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
     program = relationship("Program", back_populates="applications")
     questionnaire = relationship("Questionnaire", back_populates="applications")
-    responses = relationship("Response", back_populates="application", cascade="all, delete-orphan")
-    uploaded_files = relationship("UploadedFile", back_populates="application", cascade="all, delete-orphan")
-    reports = relationship("Report", back_populates="application", cascade="all, delete-orphan")
-    scores = relationship("Score", back_populates="application", cascade="all, delete-orphan")
-    
-    def __repr__(self):
-        return f"<Application(id={self.id}, startup_name='{self.startup_name}')>"
\ No newline at end of file
+    # Responses and scores are read together with the application, so batch-load them;
+    # files and reports carry large text and must be loaded explicitly with selectinload()
+    responses = relationship("Response", back_populates="application", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
+    uploaded_files = relationship("UploadedFile", back_populates="application", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
+    reports = relationship("Report", back_populates="application", cascade="all, delete-orphan", passive_deletes=True, lazy="raise", foreign_keys="Report.application_id")
+    scores = relationship("Score", back_populates="application", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin")
\ No newline at end of file
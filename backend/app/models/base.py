@@ -1,18 +1,49 @@
-from sqlalchemy import Column, Integer, DateTime, func
-from sqlalchemy.ext.declarative import declarative_base
-from typing import Any
+from sqlalchemy import Column, Integer, DateTime, JSON, String, func
+from sqlalchemy.dialects.postgresql import CITEXT, JSONB
+from sqlalchemy.orm import DeclarativeBase
+from typing import Any, ClassVar
 
-Base = declarative_base()
+
+class Base(DeclarativeBase):
+    """Declarative base shared by all models"""
+
+# JSONB on PostgreSQL (stored pre-parsed, GIN-indexable), plain JSON elsewhere (e.g. SQLite tests)
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
+# Case-insensitive text on PostgreSQL, so equality and unique indexes ignore case
+CITextType = String(255).with_variant(CITEXT(), "postgresql")
 
 class BaseModel(Base):
     """Base model class with common fields and methods"""
     
     __abstract__ = True
     
+    # Attributes shown by __repr__ after the id
+    _repr_attrs: ClassVar[tuple[str, ...]] = ()
+    
     id = Column(Integer, primary_key=True, index=True)
     created_at = Column(DateTime, default=func.now(), nullable=False)
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now(), nullable=False)
     
+    @classmethod
+    def _column_names(cls) -> tuple[str, ...]:
+        """Column names for this model, resolved once per class"""
+        names = cls.__dict__.get("_column_names_cache")
+        if names is None:
+            names = tuple(c.name for c in cls.__table__.columns)
+            cls._column_names_cache = names
+        return names
+    
     def to_dict(self) -> dict[str, Any]:
         """Convert model instance to dictionary"""
-        return {c.name: getattr(self, c.name) for c in self.__table__.columns}
\ No newline at end of file
+        return {name: getattr(self, name) for name in self._column_names()}
+    
+    def __repr__(self) -> str:
+        # Read only what is already loaded: going through the attributes would
+        # refresh expired instances or lazy-load deferred columns from a log call
+        loaded = self.__dict__
+        fields = ", ".join(
+            f"{name}={loaded[name]!r}" if name in loaded else f"{name}=?"
+            for name in ("id", *self._repr_attrs)
+        )
+        return f"<{type(self).__name__}({fields})>"
\ No newline at end of file
@@ -1,21 +1,23 @@
-from sqlalchemy import Column, String, Text, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, JSONBType
 
 class CalibrationAnswer(BaseModel):
     """Accelerator preferences and calibration responses"""
     
     __tablename__ = "calibration_answers"
+    _repr_attrs = ("question_key",)
+    __table_args__ = (
+        # One answer per calibration question per program
+        Index("ix_calibration_answers_program_question_key", "program_id", "question_key", unique=True),
+    )
     
     question_key = Column(String(255), nullable=False)  # e.g., "team_importance", "market_size_preference"
-    answer_value = Column(JSON, nullable=False)  # Flexible storage for various answer types
+    answer_value = Column(JSONBType, nullable=False)  # Flexible storage for various answer types
     answer_text = Column(Text)  # Human-readable version of the answer
     
     # Foreign keys
-    program_id = Column(ForeignKey("programs.id"), nullable=False)
+    program_id = Column(ForeignKey("programs.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
-    program = relationship("Program", back_populates="calibration_answers")
-    
-    def __repr__(self):
-        return f"<CalibrationAnswer(id={self.id}, question_key='{self.question_key}')>"
\ No newline at end of file
+    program = relationship("Program", back_populates="calibration_answers")
\ No newline at end of file
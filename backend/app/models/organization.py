@@ -1,21 +1,19 @@
-from sqlalchemy import Column, String, Text, Boolean
+from sqlalchemy import Column, String, Text, Boolean, text
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, CITextType
 
 class Organization(BaseModel):
     """Accelerator organizations"""
     
     __tablename__ = "organizations"
+    _repr_attrs = ("name",)
     
     name = Column(String(255), nullable=False)
-    email = Column(String(255), nullable=False, unique=True)
+    email = Column(CITextType, nullable=False, unique=True)
     password_hash = Column(String(255), nullable=False)
     description = Column(Text)
     website = Column(String(255))
-    is_active = Column(Boolean, default=True, nullable=False)
+    is_active = Column(Boolean, server_default=text("true"), nullable=False)
     
     # Relationships
-    programs = relationship("Program", back_populates="organization", cascade="all, delete-orphan")
-    
-    def __repr__(self):
-        return f"<Organization(id={self.id}, name='{self.name}')>"
\ No newline at end of file
+    programs = relationship("Program", back_populates="organization", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
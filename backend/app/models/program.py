@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, ForeignKey, text
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -6,20 +6,20 @@ class Program(BaseModel):
     """Accelerator programs (e.g., TechEd Accelerator 2024)"""
     
     __tablename__ = "programs"
+    _repr_attrs = ("name",)
     
     name = Column(String(255), nullable=False)
     description = Column(Text)
-    is_active = Column(Boolean, default=True, nullable=False)
+    is_active = Column(Boolean, server_default=text("true"), nullable=False)
     
     # Foreign keys
-    organization_id = Column(ForeignKey("organizations.id"), nullable=False)
+    organization_id = Column(ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
     organization = relationship("Organization", back_populates="programs")
-    questionnaires = relationship("Questionnaire", back_populates="program", cascade="all, delete-orphan")
-    calibration_answers = relationship("CalibrationAnswer", back_populates="program", cascade="all, delete-orphan")
-    ai_guidelines = relationship("AIGuideline", back_populates="program", cascade="all, delete-orphan")
-    applications = relationship("Application", back_populates="program", cascade="all, delete-orphan")
-    
-    def __repr__(self):
-        return f"<Program(id={self.id}, name='{self.name}')>"
\ No newline at end of file
+    # Programs are loaded on every scoped request for the ownership check, so none of
+    # these collections are eager-loaded; they are queried directly by program_id
+    questionnaires = relationship("Questionnaire", back_populates="program", cascade="all, delete-orphan", passive_deletes=True)
+    calibration_answers = relationship("CalibrationAnswer", back_populates="program", cascade="all, delete-orphan", passive_deletes=True)
+    ai_guidelines = relationship("AIGuideline", back_populates="program", cascade="all, delete-orphan", passive_deletes=True)
+    applications = relationship("Application", back_populates="program", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
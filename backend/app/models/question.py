@@ -1,25 +1,27 @@
-from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, String, Text, Integer, Boolean, ForeignKey, Index, text as sql_text
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, JSONBType
 
 class Question(BaseModel):
     """Individual questions with types and validation"""
     
     __tablename__ = "questions"
+    _repr_attrs = ("question_type",)
+    __table_args__ = (
+        Index("ix_questions_questionnaire_order", "questionnaire_id", "order_index"),
+    )
     
     text = Column(Text, nullable=False)
     question_type = Column(String(50), nullable=False)  # text, multiple_choice, scale, file_upload
-    is_required = Column(Boolean, default=True, nullable=False)
+    is_required = Column(Boolean, server_default=sql_text("true"), nullable=False)
     order_index = Column(Integer, nullable=False)
-    options = Column(JSON)  # For multiple choice options, scale ranges, etc.
-    validation_rules = Column(JSON)  # For text length, file size limits, etc.
+    options = Column(JSONBType)  # For multiple choice options, scale ranges, etc.
+    validation_rules = Column(JSONBType)  # For text length, file size limits, etc.
     
     # Foreign keys
-    questionnaire_id = Column(ForeignKey("questionnaires.id"), nullable=False)
+    questionnaire_id = Column(ForeignKey("questionnaires.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
     questionnaire = relationship("Questionnaire", back_populates="questions")
-    responses = relationship("Response", back_populates="question", cascade="all, delete-orphan")
-    
-    def __repr__(self):
-        return f"<Question(id={self.id}, type='{self.question_type}')>"
\ No newline at end of file
+    # Responses per question are unbounded; load them per application instead
+    responses = relationship("Response", back_populates="question", cascade="all, delete-orphan", passive_deletes=True, lazy="raise")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Text, Boolean, ForeignKey
+from sqlalchemy import Column, String, Text, Boolean, ForeignKey, text
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -6,18 +6,17 @@ class Questionnaire(BaseModel):
     """Question sets for each program"""
     
     __tablename__ = "questionnaires"
+    _repr_attrs = ("name",)
     
     name = Column(String(255), nullable=False)
     description = Column(Text)
-    is_active = Column(Boolean, default=True, nullable=False)
+    is_active = Column(Boolean, server_default=text("true"), nullable=False)
     
     # Foreign keys
-    program_id = Column(ForeignKey("programs.id"), nullable=False)
+    program_id = Column(ForeignKey("programs.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
     program = relationship("Program", back_populates="questionnaires")
-    questions = relationship("Question", back_populates="questionnaire", cascade="all, delete-orphan")
-    applications = relationship("Application", back_populates="questionnaire", cascade="all, delete-orphan")
-    
-    def __repr__(self):
-        return f"<Questionnaire(id={self.id}, name='{self.name}')>"
\ No newline at end of file
+    # Questions (max 50) are always rendered with their questionnaire, in order
+    questions = relationship("Question", back_populates="questionnaire", cascade="all, delete-orphan", passive_deletes=True, lazy="selectin", order_by="Question.order_index")
+    applications = relationship("Application", back_populates="questionnaire", cascade="all, delete-orphan", passive_deletes=True)
\ No newline at end of file
@@ -1,57 +1,120 @@
-from sqlalchemy import Column, String, Text, ForeignKey, Float, Integer, DateTime, Boolean
-from sqlalchemy.orm import relationship
-from .base import BaseModel
+from sqlalchemy import Column, String, Text, ForeignKey, Float, Integer, DateTime, Boolean, Computed, Index, event, func, select, text, update
+from sqlalchemy.orm import relationship, deferred
+from .base import BaseModel, JSONBType
+from .application import Application
+
+# Keys of Report.sections, in report order
+REPORT_SECTIONS = (
+    "problem_solution",
+    "customer_profile",
+    "product_technology",
+    "team_structure",
+    "market_opportunity",
+    "financial_overview",
+    "key_challenges",
+    "validation_achievements",
+    "investigation_areas",
+)
+
+
+def _section_score_column(section: str) -> Column:
+    """Stored generated column exposing sections[section].score as a float"""
+    return Column(
+        Float,
+        Computed(f"CAST(sections -> '{section}' ->> 'score' AS FLOAT)", persisted=True)
+    )
+
 
 class Report(BaseModel):
     """Generated PDF reports with scores and analysis"""
     
     __tablename__ = "reports"
+    _repr_attrs = ("overall_score",)
+    __table_args__ = (
+        Index("ix_reports_application_latest", "application_id", "is_latest"),
+        # At most one latest report per application
+        Index(
+            "uq_reports_latest_per_application",
+            "application_id",
+            unique=True,
+            postgresql_where=text("is_latest"),
+            sqlite_where=text("is_latest")
+        ),
+        Index("ix_reports_overall_score", "overall_score"),
+        Index(
+            "ix_reports_sections_gin",
+            "sections",
+            postgresql_using="gin",
+            postgresql_ops={"sections": "jsonb_path_ops"}
+        ),
+    )
     
     overall_score = Column(Float, nullable=False)  # 1-10 scale
-    overall_summary = Column(Text, nullable=False)
-    
-    # 10 report sections with scores and content
-    problem_solution_score = Column(Float, nullable=False)
-    problem_solution_content = Column(Text, nullable=False)
-    
-    customer_profile_score = Column(Float, nullable=False)
-    customer_profile_content = Column(Text, nullable=False)
-    
-    product_technology_score = Column(Float, nullable=False)
-    product_technology_content = Column(Text, nullable=False)
-    
-    team_structure_score = Column(Float, nullable=False)
-    team_structure_content = Column(Text, nullable=False)
     
-    market_opportunity_score = Column(Float, nullable=False)
-    market_opportunity_content = Column(Text, nullable=False)
-    
-    financial_overview_score = Column(Float, nullable=False)
-    financial_overview_content = Column(Text, nullable=False)
-    
-    key_challenges_score = Column(Float, nullable=False)
-    key_challenges_content = Column(Text, nullable=False)
-    
-    validation_achievements_score = Column(Float, nullable=False)
-    validation_achievements_content = Column(Text, nullable=False)
-    
-    investigation_areas_score = Column(Float, nullable=False)
-    investigation_areas_content = Column(Text, nullable=False)
+    # Report body, deferred so list queries only read scores and metadata;
+    # load it for detail views with .options(undefer_group("content"))
+    overall_summary = deferred(Column(Text, nullable=False), group="content")
+    # Report sections with scores and content, stored as one document:
+    # {"problem_solution": {"score": 7.5, "content": "..."}, ...}
+    sections = deferred(Column(JSONBType, nullable=False), group="content")
+    
+    # Read-only section scores generated from `sections` for score-only queries
+    problem_solution_score = _section_score_column("problem_solution")
+    customer_profile_score = _section_score_column("customer_profile")
+    product_technology_score = _section_score_column("product_technology")
+    team_structure_score = _section_score_column("team_structure")
+    market_opportunity_score = _section_score_column("market_opportunity")
+    financial_overview_score = _section_score_column("financial_overview")
+    key_challenges_score = _section_score_column("key_challenges")
+    validation_achievements_score = _section_score_column("validation_achievements")
+    investigation_areas_score = _section_score_column("investigation_areas")
     
     # PDF generation
     pdf_file_path = Column(String(500))  # Path to generated PDF
     pdf_generated_at = Column(DateTime)
-    generation_status = Column(String(50), default="pending")  # pending, completed, failed
+    generation_status = Column(String(50), server_default=text("'pending'"))  # pending, completed, failed
     
     # Version tracking
-    version = Column(Integer, default=1, nullable=False)
-    is_latest = Column(Boolean, default=True, nullable=False)
+    version = Column(Integer, server_default=text("1"), nullable=False)
+    is_latest = Column(Boolean, server_default=text("true"), nullable=False)
     
     # Foreign keys
-    application_id = Column(ForeignKey("applications.id"), nullable=False)
+    application_id = Column(ForeignKey("applications.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
-    application = relationship("Application", back_populates="reports")
+    # Not joined: eager-loading the application would pull its responses and scores too
+    application = relationship("Application", back_populates="reports", foreign_keys=[application_id])
     
-    def __repr__(self):
-        return f"<Report(id={self.id}, overall_score={self.overall_score})>"
\ No newline at end of file
+
+@event.listens_for(Report, "before_insert")
+def supersede_latest_report(mapper, connection, target: Report) -> None:
+    """Demote the application's current latest report and number the new one, in the same flush"""
+    if target.is_latest is False:
+        return
+    
+    reports = Report.__table__
+    connection.execute(
+        update(reports)
+        .where(reports.c.application_id == target.application_id, reports.c.is_latest)
+        .values(is_latest=False)
+    )
+    if target.version is None:
+        # Rendered inline into the INSERT, so numbering needs no extra round trip
+        target.version = (
+            select(func.coalesce(func.max(reports.c.version), 0) + 1)
+            .where(reports.c.application_id == target.application_id)
+            .scalar_subquery()
+        )
+
+
+@event.listens_for(Report, "after_insert")
+def sync_application_latest_report(mapper, connection, target: Report) -> None:
+    """Copy the latest report's score onto its application so list views can skip the join"""
+    if not target.is_latest:
+        return
+    
+    connection.execute(
+        update(Application.__table__)
+        .where(Application.__table__.c.id == target.application_id)
+        .values(overall_score=target.overall_score, latest_report_id=target.id)
+    )
\ No newline at end of file
@@ -1,22 +1,32 @@
-from sqlalchemy import Column, Text, ForeignKey, JSON
+from sqlalchemy import Column, Text, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, JSONBType
 
 class Response(BaseModel):
     """Answers to questionnaire questions"""
     
     __tablename__ = "responses"
+    _repr_attrs = ("application_id",)
+    __table_args__ = (
+        Index("ix_responses_application_question", "application_id", "question_id"),
+        Index(
+            "ix_responses_response_value_gin",
+            "response_value",
+            postgresql_using="gin",
+            postgresql_ops={"response_value": "jsonb_path_ops"}
+        ),
+    )
     
-    response_value = Column(JSON, nullable=False)  # Flexible storage for different answer types
+    response_value = Column(JSONBType, nullable=False)  # Flexible storage for different answer types
     response_text = Column(Text)  # Human-readable version for text responses
     
     # Foreign keys
-    application_id = Column(ForeignKey("applications.id"), nullable=False)
-    question_id = Column(ForeignKey("questions.id"), nullable=False)
+    application_id = Column(ForeignKey("applications.id", ondelete="CASCADE"), nullable=False)
+    question_id = Column(ForeignKey("questions.id", ondelete="CASCADE"), nullable=False, index=True)
     
     # Relationships
-    application = relationship("Application", back_populates="responses")
-    question = relationship("Question", back_populates="responses")
-    
-    def __repr__(self):
-        return f"<Response(id={self.id}, application_id={self.application_id})>"
\ No newline at end of file
+    # Responses are read through Application.responses: resolving the parent from the
+    # identity map is fine, fetching it with a query mid-handler is a bug
+    application = relationship("Application", back_populates="responses", lazy="raise_on_sql")
+    # A response is always displayed with its question text
+    question = relationship("Question", back_populates="responses", lazy="joined")
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Text, ForeignKey, Boolean
+from sqlalchemy import Column, String, Float, Text, ForeignKey, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -6,19 +6,23 @@ class Score(BaseModel):
     """Detailed scoring breakdown for applications"""
     
     __tablename__ = "scores"
+    _repr_attrs = ("category", "score_value")
+    __table_args__ = (
+        Index("ix_scores_application_category", "application_id", "category"),
+    )
     
     category = Column(String(255), nullable=False)  # e.g., "team_structure", "market_opportunity"
     score_value = Column(Float, nullable=False)  # 1-10 scale
     justification = Column(Text, nullable=False)  # AI-generated reasoning
     confidence = Column(Float)  # AI confidence in score (0-1)
-    is_overridden = Column(Boolean, default=False, nullable=False)  # Manual override flag
+    is_overridden = Column(Boolean, server_default=text("false"), nullable=False)  # Manual override flag
     original_score = Column(Float)  # Original AI score before override
     
     # Foreign keys
-    application_id = Column(ForeignKey("applications.id"), nullable=False)
+    application_id = Column(ForeignKey("applications.id", ondelete="CASCADE"), nullable=False)
     
     # Relationships
-    application = relationship("Application", back_populates="scores")
-    
-    def __repr__(self):
-        return f"<Score(id={self.id}, category='{self.category}', score={self.score_value})>"
\ No newline at end of file
+    # Scores are reached through Application.scores, so the parent is already in the
+    # identity map; a joined load here would re-run the application's selectin loaders,
+    # and any SQL emitted to fetch it is a bug
+    application = relationship("Application", back_populates="scores", lazy="raise_on_sql")
\ No newline at end of file
@@ -8,6 +8,7 @@ from .organization import (
 
 from .question import (
     QuestionType,
+    QuestionTypeValue,
     TextQuestionOptions,
     MultipleChoiceQuestionOptions,
     ScaleQuestionOptions,
@@ -21,6 +22,29 @@ from .question import (
     QuestionReorderRequest
 )
 
+from .questionnaire import (
+    QuestionnaireBase,
+    QuestionnaireCreate,
+    QuestionnaireUpdate,
+    QuestionnaireResponse,
+    QuestionnaireListResponse,
+    QuestionnaireDetailResponse
+)
+
+from .program import (
+    ProgramBase,
+    ProgramCreate,
+    ProgramUpdate,
+    Program,
+    ProgramStats,
+    ProgramWithStats,
+    ProgramListResponse,
+    ProgramResponse,
+    ProgramDetailsResponse,
+    ProgramContext,
+    ProgramSummary
+)
+
 from .calibration import (
     CalibrationQuestionType,
     CalibrationAnswerBase,
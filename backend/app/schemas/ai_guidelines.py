@@ -5,7 +5,13 @@ Handles request/response validation for guidelines generation and management.
 
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Model names accepted for generation requests
+SUPPORTED_MODELS = (
+    "claude-3.5-sonnet", "claude-3-opus", "claude-3-haiku",
+    "gpt-4o", "gpt-4o-mini"
+)
 
 # Base schemas for guidelines structure
 class ScoringGuide(BaseModel):
@@ -15,31 +21,32 @@ class ScoringGuide(BaseModel):
     range_6_7: str = Field(..., alias="6-7", description="Description for scores 6-7")
     range_8_10: str = Field(..., alias="8-10", description="Description for scores 8-10")
     
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True, frozen=True)
 
 class GuidelineCategory(BaseModel):
     """Individual guideline category with scoring criteria."""
     section: str = Field(..., description="Section identifier (e.g., 'problem_solution_fit')")
     name: str = Field(..., description="Human-readable category name")
     weight: int = Field(..., ge=1, le=10, description="Importance weight (1-10)")
-    criteria: List[str] = Field(..., min_items=1, description="List of evaluation criteria")
-    red_flags: List[str] = Field(..., min_items=1, description="List of warning signs")
+    criteria: List[str] = Field(..., min_length=1, description="List of evaluation criteria")
+    red_flags: List[str] = Field(..., min_length=1, description="List of warning signs")
     scoring_guide: ScoringGuide = Field(..., description="Scoring guidance for 1-10 scale")
+    
+    model_config = ConfigDict(frozen=True)
 
 class GeneratedGuidelines(BaseModel):
     """Complete set of generated guidelines."""
-    categories: List[GuidelineCategory] = Field(..., min_items=1, description="Guidelines categories")
+    categories: List[GuidelineCategory] = Field(..., min_length=1, description="Guidelines categories")
+    
+    # Parsed guidelines are cached and shared between requests, so they must not be mutated
+    model_config = ConfigDict(frozen=True)
     
-    @validator('categories')
+    @field_validator('categories')
+    @classmethod
     def validate_categories(cls, v):
-        """Validate guidelines categories."""
-        if len(v) == 0:
-            raise ValueError("At least one category is required")
-        
+        """Validate guidelines categories (min_length already rejects an empty list)."""
         # Check for duplicate sections
-        sections = [cat.section for cat in v]
-        if len(sections) != len(set(sections)):
+        if len({cat.section for cat in v}) != len(v):
             raise ValueError("Duplicate category sections found")
         
         return v
@@ -53,15 +60,12 @@ class GenerateGuidelinesRequest(BaseModel):
         description="AI model to use for generation"
     )
     
-    @validator('model')
+    @field_validator('model')
+    @classmethod
     def validate_model(cls, v):
         """Validate AI model selection."""
-        supported_models = [
-            "claude-3.5-sonnet", "claude-3-opus", "claude-3-haiku",
-            "gpt-4o", "gpt-4o-mini"
-        ]
-        if v and v not in supported_models:
-            raise ValueError(f"Unsupported model. Supported models: {supported_models}")
+        if v and v not in SUPPORTED_MODELS:
+            raise ValueError(f"Unsupported model. Supported models: {list(SUPPORTED_MODELS)}")
         return v
 
 class SaveGuidelinesRequest(BaseModel):
@@ -87,6 +91,9 @@ class GuidelinesGenerationResponse(BaseModel):
     model_used: Optional[str] = Field(default=None, description="AI model that was used")
     cached: bool = Field(default=False, description="Whether result was from cache")
     error: Optional[str] = Field(default=None, description="Error message if failed")
+    
+    # "model_used" would otherwise clash with pydantic's reserved model_ prefix
+    model_config = ConfigDict(protected_namespaces=())
 
 class SavedGuidelines(BaseModel):
     """Saved guidelines with metadata."""
@@ -99,8 +106,7 @@ class SavedGuidelines(BaseModel):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class GuidelinesSaveResponse(BaseModel):
     """Response for saving guidelines."""
@@ -151,5 +157,4 @@ class AIGuidelineDB(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
@@ -0,0 +1,5 @@
+from pydantic import ConfigDict
+
+
+# Shared by read-only response schemas that are built from ORM rows
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra='forbid', from_attributes=True)
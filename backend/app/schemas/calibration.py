@@ -1,5 +1,6 @@
+from datetime import datetime
 from typing import Optional, Dict, Any, List, Union
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from enum import Enum
 
 class CalibrationQuestionType(str, Enum):
@@ -27,22 +28,25 @@ class CalibrationAnswerResponse(CalibrationAnswerBase):
     """Schema for calibration answer responses"""
     id: int
     program_id: int
-    created_at: str
-    updated_at: str
+    created_at: datetime
+    updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CalibrationQuestionOption(BaseModel):
     """Option for multiple choice calibration questions"""
     value: str
     label: str
+    
+    model_config = ConfigDict(frozen=True)
 
 class CalibrationQuestionScaleLabels(BaseModel):
     """Scale labels for scale questions"""
     min_label: Optional[str] = None
     max_label: Optional[str] = None
     scale_labels: Optional[Dict[int, str]] = None
+    
+    model_config = ConfigDict(frozen=True)
 
 class CalibrationQuestion(BaseModel):
     """Complete calibration question with metadata"""
@@ -62,6 +66,8 @@ class CalibrationQuestion(BaseModel):
     # Text question fields
     placeholder: Optional[str] = None
     max_length: Optional[int] = Field(None, gt=0)
+    
+    model_config = ConfigDict(frozen=True)
 
 class CalibrationCategory(BaseModel):
     """Category of calibration questions"""
@@ -71,7 +77,7 @@ class CalibrationCategory(BaseModel):
 
 class CalibrationSessionRequest(BaseModel):
     """Request to start or update calibration session"""
-    answers: List[CalibrationAnswerCreate] = Field(..., min_items=1)
+    answers: List[CalibrationAnswerCreate] = Field(..., min_length=1)
 
 class CalibrationSessionResponse(BaseModel):
     """Response for calibration session"""
@@ -82,8 +88,7 @@ class CalibrationSessionResponse(BaseModel):
     answers: List[CalibrationAnswerResponse]
     missing_questions: List[str]
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class CalibrationCompletionStatus(BaseModel):
     """Calibration completion status"""
@@ -1,7 +1,11 @@
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, StringConstraints
+from typing import Annotated, Optional
 from datetime import datetime
 
+# Cheap shape check for emails that are only looked up, never stored; full
+# email_validator checks (EmailStr) run once, when an organization is created
+LookupEmail = Annotated[str, StringConstraints(strip_whitespace=True, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")]
+
 
 class OrganizationBase(BaseModel):
     """Base organization schema"""
@@ -25,16 +29,16 @@ class OrganizationUpdate(BaseModel):
 
 class OrganizationResponse(OrganizationBase):
     """Schema for organization response"""
+    email: str  # Validated on registration, so not re-checked for every response
     id: int
     is_active: bool
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class OrganizationLogin(BaseModel):
     """Schema for organization login"""
-    email: EmailStr
+    email: LookupEmail
     password: str
\ No newline at end of file
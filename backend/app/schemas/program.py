@@ -3,9 +3,12 @@ Pydantic schemas for Program management API endpoints.
 Handles request/response validation for program CRUD operations.
 """
 
-from typing import List, Optional
+from dataclasses import dataclass
+from typing import Any, List, Optional
 from datetime import datetime
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, field_validator
+
+from app.schemas.base import RESPONSE_MODEL_CONFIG
 
 # Base program schemas
 class ProgramBase(BaseModel):
@@ -14,12 +17,14 @@ class ProgramBase(BaseModel):
     description: Optional[str] = Field(default=None, max_length=2000, description="Program description")
     is_active: bool = Field(default=True, description="Whether program is active")
 
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         """Validate program name."""
-        if not v or not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Program name cannot be empty")
-        return v.strip()
+        return stripped
 
 # Request schemas
 class ProgramCreate(ProgramBase):
@@ -32,12 +37,16 @@ class ProgramUpdate(BaseModel):
     description: Optional[str] = Field(default=None, max_length=2000, description="Program description")
     is_active: Optional[bool] = Field(default=None, description="Whether program is active")
 
-    @validator('name')
+    @field_validator('name')
+    @classmethod
     def validate_name(cls, v):
         """Validate program name if provided."""
-        if v is not None and (not v or not v.strip()):
+        if v is None:
+            return v
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("Program name cannot be empty")
-        return v.strip() if v else v
+        return stripped
 
 # Response schemas
 class Program(ProgramBase):
@@ -47,15 +56,31 @@ class Program(ProgramBase):
     created_at: datetime = Field(..., description="Creation timestamp")
     updated_at: datetime = Field(..., description="Last update timestamp")
     
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
+    
+    @classmethod
+    def from_row(cls, row: Any, **values: Any) -> "Program":
+        """
+        Build from a Program ORM row without re-validating it.
+        
+        The row must come from the database (already validated on write); extra
+        values such as statistics are passed through as keyword arguments.
+        """
+        data = {name: getattr(row, name) for name in Program.model_fields}
+        data.update(values)
+        return cls.model_construct(**data)
 
-class ProgramWithStats(Program):
-    """Program with additional statistics."""
+class ProgramStats(BaseModel):
+    """Statistics shared by program views."""
     questionnaire_count: int = Field(default=0, description="Number of questionnaires")
     calibration_completion: float = Field(default=0.0, description="Calibration completion percentage")
     has_active_guidelines: bool = Field(default=False, description="Whether program has active AI guidelines")
     application_count: int = Field(default=0, description="Number of applications received")
+    
+    model_config = RESPONSE_MODEL_CONFIG
+
+class ProgramWithStats(ProgramStats, Program):
+    """Program with additional statistics, flattened alongside the program fields."""
 
 # List response schemas
 class ProgramListResponse(BaseModel):
@@ -79,24 +104,33 @@ class ProgramDetailsResponse(BaseModel):
     error: Optional[str] = Field(default=None, description="Error message if failed")
 
 # Program context schemas
-class ProgramContext(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProgramContext:
     """Program context for navigation and UI."""
-    id: int = Field(..., description="Program ID")
-    name: str = Field(..., description="Program name")
-    organization_id: int = Field(..., description="Organization ID")
-    is_active: bool = Field(..., description="Whether program is active")
+    id: int
+    name: str
+    organization_id: int
+    is_active: bool
+    
+    @classmethod
+    def from_row(cls, row: Any) -> "ProgramContext":
+        """Build from a Program ORM row."""
+        return cls(
+            id=row.id,
+            name=row.name,
+            organization_id=row.organization_id,
+            is_active=row.is_active
+        )
 
 class ProgramSummary(BaseModel):
     """Summary information about a program."""
     program: Program = Field(..., description="Program information")
-    questionnaires: int = Field(..., description="Number of questionnaires")
-    calibration_complete: bool = Field(..., description="Whether calibration is complete")
-    guidelines_active: bool = Field(..., description="Whether guidelines are active")
-    applications: int = Field(..., description="Number of applications")
+    stats: ProgramStats = Field(..., description="Program statistics")
     last_activity: Optional[datetime] = Field(default=None, description="Last activity timestamp")
 
 # Database model conversion schemas  
-class ProgramDB(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProgramDB:
     """Database representation of program."""
     id: int
     name: str
@@ -106,5 +140,15 @@ class ProgramDB(BaseModel):
     created_at: datetime
     updated_at: datetime
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    @classmethod
+    def from_row(cls, row: Any) -> "ProgramDB":
+        """Build from a Program ORM row."""
+        return cls(
+            id=row.id,
+            name=row.name,
+            description=row.description,
+            is_active=row.is_active,
+            organization_id=row.organization_id,
+            created_at=row.created_at,
+            updated_at=row.updated_at
+        )
\ No newline at end of file
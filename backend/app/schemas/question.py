@@ -1,7 +1,15 @@
-from typing import Optional, List, Union, Dict, Any
-from pydantic import BaseModel, Field, validator
+from typing import Annotated, Optional, Dict, List, Literal, Tuple, Union, Any
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from enum import Enum
 
+from app.schemas.base import RESPONSE_MODEL_CONFIG
+
+
+_DEFAULT_ALLOWED_EXTENSIONS: Tuple[str, ...] = (".pdf",)
+
+# Option models keep client-specific keys alongside the typed ones
+_OPTIONS_MODEL_CONFIG = ConfigDict(extra='allow')
+
 
 class QuestionType(str, Enum):
     """Question type enumeration"""
@@ -11,8 +19,15 @@ class QuestionType(str, Enum):
     FILE_UPLOAD = "file_upload"
 
 
+# Values of QuestionType, used as the field annotation so validation stays in pydantic-core
+QuestionTypeValue = Literal["text", "multiple_choice", "scale", "file_upload"]
+
+
 class TextQuestionOptions(BaseModel):
     """Options for text questions"""
+    model_config = _OPTIONS_MODEL_CONFIG
+
+    kind: Literal["text"] = "text"
     max_length: Optional[int] = Field(None, ge=1, le=10000)
     min_length: Optional[int] = Field(None, ge=0)
     placeholder: Optional[str] = None
@@ -21,13 +36,19 @@ class TextQuestionOptions(BaseModel):
 
 class MultipleChoiceQuestionOptions(BaseModel):
     """Options for multiple choice questions"""
-    choices: List[str] = Field(..., min_items=2, max_items=20)
+    model_config = _OPTIONS_MODEL_CONFIG
+
+    kind: Literal["multiple_choice"] = "multiple_choice"
+    choices: List[str] = Field(..., min_length=2, max_length=20)
     allow_multiple: bool = False
     randomize_order: bool = False
 
 
 class ScaleQuestionOptions(BaseModel):
     """Options for scale questions"""
+    model_config = _OPTIONS_MODEL_CONFIG
+
+    kind: Literal["scale"] = "scale"
     min_value: int = Field(1, ge=1, le=10)
     max_value: int = Field(10, ge=1, le=10)
     step: int = Field(1, ge=1)
@@ -37,26 +58,62 @@ class ScaleQuestionOptions(BaseModel):
 
 class FileUploadQuestionOptions(BaseModel):
     """Options for file upload questions"""
+    model_config = _OPTIONS_MODEL_CONFIG
+
+    kind: Literal["file_upload"] = "file_upload"
     max_file_size_mb: int = Field(50, ge=1, le=100)
-    allowed_extensions: List[str] = Field(default_factory=lambda: [".pdf"])
+    allowed_extensions: Tuple[str, ...] = _DEFAULT_ALLOWED_EXTENSIONS
     max_files: int = Field(1, ge=1, le=5)
 
 
+QuestionOptions = Annotated[
+    Union[
+        TextQuestionOptions,
+        MultipleChoiceQuestionOptions,
+        ScaleQuestionOptions,
+        FileUploadQuestionOptions
+    ],
+    Field(discriminator="kind")
+]
+
+
 class QuestionValidationRules(BaseModel):
     """Validation rules for questions"""
     required: bool = True
     custom_error_message: Optional[str] = None
 
 
-class QuestionBase(BaseModel):
+class _TaggedOptionsModel(BaseModel):
+    """Ties the options discriminator to question_type on question schemas"""
+
+    @model_validator(mode='before')
+    @classmethod
+    def tag_options_with_question_type(cls, data: Any) -> Any:
+        """Default the options discriminator to the question type when omitted"""
+        if isinstance(data, dict):
+            options = data.get('options')
+            question_type = data.get('question_type')
+            if isinstance(options, dict) and 'kind' not in options and question_type is not None:
+                data = {**data, 'options': {**options, 'kind': question_type}}
+        return data
+
+    @model_validator(mode='after')
+    def validate_options_match_type(self):
+        """Validate that options match the question type if both are provided"""
+        if self.options is not None and self.question_type is not None:
+            if self.options.kind != self.question_type:
+                raise ValueError(f"Invalid options type for {self.question_type} question")
+        return self
+
+
+class QuestionBase(_TaggedOptionsModel):
     """Base question schema"""
     text: str = Field(..., min_length=1, max_length=1000)
-    question_type: QuestionType
+    question_type: QuestionTypeValue
     is_required: bool = True
     order_index: int = Field(..., ge=0)
-    options: Optional[Dict[str, Any]] = None
-    validation_rules: Optional[Dict[str, Any]] = None
-
+    options: Optional[QuestionOptions] = None
+    validation_rules: Optional[QuestionValidationRules] = None
 
 
 class QuestionCreate(QuestionBase):
@@ -64,50 +121,51 @@ class QuestionCreate(QuestionBase):
     questionnaire_id: Optional[int] = Field(None, gt=0)  # Optional since it comes from URL path
 
 
-class QuestionUpdate(BaseModel):
+class QuestionUpdate(_TaggedOptionsModel):
     """Schema for updating a question"""
     text: Optional[str] = Field(None, min_length=1, max_length=1000)
-    question_type: Optional[QuestionType] = None
+    question_type: Optional[QuestionTypeValue] = None
     is_required: Optional[bool] = None
     order_index: Optional[int] = Field(None, ge=0)
-    options: Optional[Union[
-        TextQuestionOptions,
-        MultipleChoiceQuestionOptions,
-        ScaleQuestionOptions,
-        FileUploadQuestionOptions
-    ]] = None
+    options: Optional[QuestionOptions] = None
     validation_rules: Optional[QuestionValidationRules] = None
 
-    @validator('options')
-    def validate_options_match_type(cls, v, values):
-        """Validate that options match the question type if both are provided"""
-        if v is None or 'question_type' not in values or values['question_type'] is None:
-            return v
-        
-        question_type = values['question_type']
-        
-        type_option_map = {
-            QuestionType.TEXT: TextQuestionOptions,
-            QuestionType.MULTIPLE_CHOICE: MultipleChoiceQuestionOptions,
-            QuestionType.SCALE: ScaleQuestionOptions,
-            QuestionType.FILE_UPLOAD: FileUploadQuestionOptions
-        }
-        
-        if not isinstance(v, type_option_map[question_type]):
-            raise ValueError(f"Invalid options type for {question_type} question")
-        
-        return v
-
-
-class QuestionResponse(QuestionBase):
-    """Schema for question responses"""
+
+class QuestionResponse(BaseModel):
+    """
+    Schema for question responses.
+    
+    Options and validation rules are returned as stored: rows created before the
+    typed option schemas may not match them, and they must read back unchanged.
+    """
+    text: str
+    question_type: QuestionTypeValue
+    is_required: bool = True
+    order_index: int
+    options: Optional[Dict[str, Any]] = None
+    validation_rules: Optional[Dict[str, Any]] = None
     id: int
     questionnaire_id: int
     created_at: str
     updated_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
+
+    @classmethod
+    def from_row(cls, question: Any) -> "QuestionResponse":
+        """Build from a Question ORM row without re-validating stored values"""
+        return cls.model_construct(
+            id=question.id,
+            text=question.text,
+            question_type=question.question_type,
+            is_required=question.is_required,
+            order_index=question.order_index,
+            options=question.options,
+            validation_rules=question.validation_rules,
+            questionnaire_id=question.questionnaire_id,
+            created_at=question.created_at.isoformat() if question.created_at else "",
+            updated_at=question.updated_at.isoformat() if question.updated_at else ""
+        )
 
 
 class QuestionListResponse(BaseModel):
@@ -119,11 +177,15 @@ class QuestionListResponse(BaseModel):
 
 class QuestionReorderRequest(BaseModel):
     """Schema for reordering questions"""
-    question_order: List[int] = Field(..., min_items=1)
+    question_order: List[int] = Field(..., min_length=1)
 
-    @validator('question_order')
+    @field_validator('question_order')
+    @classmethod
     def validate_unique_ids(cls, v):
-        """Ensure all question IDs are unique"""
-        if len(v) != len(set(v)):
-            raise ValueError("Question IDs must be unique")
+        """Ensure all question IDs are unique, stopping at the first duplicate"""
+        seen = set()
+        for question_id in v:
+            if question_id in seen:
+                raise ValueError("Question IDs must be unique")
+            seen.add(question_id)
         return v
\ No newline at end of file
@@ -1,7 +1,9 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, List, Optional
 from pydantic import BaseModel, Field
 
+from app.schemas.base import RESPONSE_MODEL_CONFIG
+
 
 class QuestionnaireBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=200, description="Name of the questionnaire")
@@ -26,8 +28,21 @@ class QuestionnaireResponse(QuestionnaireBase):
     updated_at: datetime
     question_count: int = Field(default=0, description="Number of questions in this questionnaire")
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_MODEL_CONFIG
+
+    @classmethod
+    def from_row(cls, questionnaire: Any, question_count: int) -> "QuestionnaireResponse":
+        """Build from a Questionnaire ORM row without re-validating stored values"""
+        return cls.model_construct(
+            id=questionnaire.id,
+            name=questionnaire.name,
+            description=questionnaire.description,
+            is_active=questionnaire.is_active,
+            program_id=questionnaire.program_id,
+            created_at=questionnaire.created_at,
+            updated_at=questionnaire.updated_at,
+            question_count=question_count
+        )
 
 
 class QuestionnaireListResponse(BaseModel):
@@ -46,5 +61,4 @@ class QuestionnaireDetailResponse(BaseModel):
     question_count: int = Field(default=0, description="Number of questions in this questionnaire")
     questions: List = Field(default_factory=list, description="List of questions in this questionnaire")
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = RESPONSE_MODEL_CONFIG
\ No newline at end of file
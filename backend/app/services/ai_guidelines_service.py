@@ -3,9 +3,16 @@ AI Guidelines Service - Business logic for AI-powered guidelines generation and
 Handles the complete workflow from calibration data to stored, versioned guidelines.
 """
 
+import asyncio
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import groupby
+from operator import attrgetter
 from typing import Dict, List, Any, Optional, Tuple
-from sqlalchemy.orm import Session
+from sqlalchemy import case, exists, func, insert, or_, select, update
+from sqlalchemy.orm import Session, defer
 from datetime import datetime
 import json
 
@@ -13,7 +20,7 @@ from app.models.ai_guideline import AIGuideline
 from app.models.program import Program
 from app.models.calibration_answer import CalibrationAnswer
 from app.schemas.ai_guidelines import (
-    GeneratedGuidelines, GuidelineCategory, SavedGuidelines,
+    GeneratedGuidelines, GuidelineCategory, SavedGuidelines, ScoringGuide,
     GuidelinesGenerationResponse, GuidelinesSaveResponse,
     GuidelinesListResponse, GuidelinesActivationResponse,
     GuidelinesStatusResponse, GuidelinesCacheStats
@@ -22,12 +29,50 @@ from app.services.openrouter_service import openrouter_service
 
 logger = logging.getLogger(__name__)
 
+# Parsed guidelines kept per process; each entry is a few KB
+GUIDELINES_CACHE_SIZE = 256
+
+# Used for stored categories saved without a scoring guide
+DEFAULT_SCORING_GUIDE = {
+    "1-3": "Low score",
+    "4-5": "Below average",
+    "6-7": "Above average",
+    "8-10": "High score"
+}
+
+
+@lru_cache(maxsize=128)
+def _humanize_section(section: str) -> str:
+    """Display name for a section key, e.g. business_model -> Business Model."""
+    return section.replace("_", " ").title()
+
+
+def _criteria_document(category: GuidelineCategory) -> Dict[str, Any]:
+    """Stored criteria JSON for a category; scoring guide ranges keyed as "1-3" etc."""
+    scoring_guide = category.scoring_guide
+    return {
+        "name": category.name,
+        "criteria": category.criteria,
+        "red_flags": category.red_flags,
+        "scoring_guide": {
+            "1-3": scoring_guide.range_1_3,
+            "4-5": scoring_guide.range_4_5,
+            "6-7": scoring_guide.range_6_7,
+            "8-10": scoring_guide.range_8_10
+        }
+    }
+
+
 class AIGuidelinesService:
     """Service for AI guidelines generation, storage, and management."""
     
     def __init__(self):
         """Initialize the AI Guidelines Service."""
-        pass
+        # (program_id, version) -> parsed guidelines. Saved versions are never
+        # modified, so entries stay valid across activation changes
+        self._guidelines_cache: "OrderedDict[Tuple[int, int], GeneratedGuidelines]" = OrderedDict()
+        # Sync endpoints share this instance across threadpool workers
+        self._guidelines_cache_lock = threading.Lock()
     
     async def generate_guidelines_from_calibration(
         self,
@@ -49,34 +94,23 @@ class AIGuidelinesService:
             GuidelinesGenerationResponse with generated guidelines or error
         """
         try:
-            # Verify program belongs to organization
-            program = db.query(Program).filter(
-                Program.id == program_id,
-                Program.organization_id == organization_id
-            ).first()
+            # The session is synchronous; keep its blocking I/O off the event loop
+            calibration_data = await asyncio.to_thread(
+                self._load_calibration_data, db, program_id, organization_id
+            )
             
-            if not program:
+            if calibration_data is None:
                 return GuidelinesGenerationResponse(
                     success=False,
                     error="Program not found or access denied"
                 )
             
-            # Get calibration data for the program
-            calibration_answers = db.query(CalibrationAnswer).filter(
-                CalibrationAnswer.program_id == program_id
-            ).all()
-            
-            if not calibration_answers:
+            if not calibration_data:
                 return GuidelinesGenerationResponse(
                     success=False,
                     error="No calibration data found. Please complete calibration first."
                 )
             
-            # Convert calibration answers to dictionary
-            calibration_data = {}
-            for answer in calibration_answers:
-                calibration_data[answer.question_key] = answer.answer_value
-            
             # Generate guidelines using OpenRouter
             logger.info(f"Generating guidelines for program {program_id} with {len(calibration_data)} calibration answers")
             
@@ -86,7 +120,7 @@ class AIGuidelinesService:
             )
             
             # Convert to Pydantic model for validation
-            guidelines = GeneratedGuidelines(**generated_data)
+            guidelines = GeneratedGuidelines.model_validate(generated_data)
             
             return GuidelinesGenerationResponse(
                 success=True,
@@ -126,73 +160,65 @@ class AIGuidelinesService:
             GuidelinesSaveResponse with saved guidelines or error
         """
         try:
-            # Verify program belongs to organization
-            program = db.query(Program).filter(
-                Program.id == program_id,
-                Program.organization_id == organization_id
-            ).first()
-            
-            if not program:
+            # Verify program belongs to organization and get the next version number
+            # in one round trip; locking the program row serializes concurrent saves
+            # so two of them cannot claim the same version
+            next_version = db.execute(
+                select(
+                    select(func.coalesce(func.max(AIGuideline.version), 0) + 1).where(
+                        AIGuideline.program_id == Program.id
+                    ).scalar_subquery()
+                ).where(
+                    Program.id == program_id,
+                    Program.organization_id == organization_id
+                ).with_for_update()
+            ).scalar_one_or_none()
+            
+            if next_version is None:
                 return GuidelinesSaveResponse(
                     success=False,
                     error="Program not found or access denied"
                 )
             
-            # Get next version number
-            latest_version = db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id
-            ).order_by(AIGuideline.version.desc()).first()
-            
-            next_version = (latest_version.version + 1) if latest_version else 1
-            
             # If activating, deactivate all existing guidelines
             if is_active:
                 db.query(AIGuideline).filter(
                     AIGuideline.program_id == program_id,
                     AIGuideline.is_active == True
-                ).update({"is_active": False})
+                ).update({"is_active": False}, synchronize_session=False)
             
             # Save each category as a separate record
-            saved_guidelines = []
-            for category in guidelines.categories:
-                # Convert category to database format
-                criteria_json = {
-                    "name": category.name,
-                    "criteria": category.criteria,
-                    "red_flags": category.red_flags,
-                    "scoring_guide": {
-                        "1-3": category.scoring_guide.range_1_3,
-                        "4-5": category.scoring_guide.range_4_5,
-                        "6-7": category.scoring_guide.range_6_7,
-                        "8-10": category.scoring_guide.range_8_10
-                    }
+            mappings = [
+                {
+                    "program_id": program_id,
+                    "section": category.section,
+                    "weight": category.weight,
+                    "criteria": _criteria_document(category),
+                    "prompt_template": "",  # TODO: Store prompts if needed
+                    "is_active": is_active,
+                    "version": next_version
                 }
-                
-                # Create database record
-                guideline_record = AIGuideline(
-                    program_id=program_id,
-                    section=category.section,
-                    weight=category.weight,
-                    criteria=criteria_json,
-                    prompt_template="",  # TODO: Store prompts if needed
-                    is_active=is_active,
-                    version=next_version
-                )
-                
-                db.add(guideline_record)
-                saved_guidelines.append(guideline_record)
+                for category in guidelines.categories
+            ]
+            
+            # Insert all categories in one batched statement; RETURNING replaces per-row refreshes
+            saved_rows = db.execute(
+                insert(AIGuideline).returning(
+                    AIGuideline.id,
+                    AIGuideline.created_at,
+                    AIGuideline.updated_at
+                ),
+                mappings
+            ).all()
             
             # Commit the transaction
             db.commit()
             
-            # Refresh the records to get IDs and timestamps
-            for record in saved_guidelines:
-                db.refresh(record)
-            
-            logger.info(f"Saved guidelines version {next_version} for program {program_id} ({len(saved_guidelines)} categories)")
+            logger.info(f"Saved guidelines version {next_version} for program {program_id} ({len(saved_rows)} categories)")
             
-            # Convert back to response format (using first record for metadata)
-            first_record = saved_guidelines[0]
+            # Convert back to response format (using first record for metadata);
+            # batched RETURNING rows are unordered, so pick the lowest id
+            first_record = min(saved_rows, key=lambda row: row.id)
             response_guidelines = SavedGuidelines(
                 id=first_record.id,
                 program_id=program_id,
@@ -235,72 +261,37 @@ class AIGuidelinesService:
             GuidelinesListResponse with guidelines history
         """
         try:
-            # Verify program belongs to organization
-            program = db.query(Program).filter(
-                Program.id == program_id,
-                Program.organization_id == organization_id
-            ).first()
+            # Stream versions newest first; rows are ordered by version, so each
+            # version's categories are contiguous and only one batch is held at a time.
+            # Streaming uses a server-side cursor, so db must be a transactional session
+            guidelines_records = db.execute(
+                select(AIGuideline).options(
+                    defer(AIGuideline.prompt_template)
+                ).where(
+                    AIGuideline.program_id == self._program_scope(program_id, organization_id)
+                ).order_by(
+                    AIGuideline.version.desc(), AIGuideline.section
+                ).execution_options(yield_per=64)
+            ).scalars()
             
-            if not program:
-                return GuidelinesListResponse(
-                    success=False,
-                    guidelines=[],
-                    error="Program not found or access denied"
-                )
-            
-            # Get all guideline versions grouped by version number
-            guidelines_records = db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id
-            ).order_by(AIGuideline.version.desc(), AIGuideline.section).all()
-            
-            if not guidelines_records:
-                return GuidelinesListResponse(
-                    success=True,
-                    guidelines=[],
-                    active_version=None
-                )
-            
-            # Group by version and convert to response format
-            guidelines_by_version = {}
+            saved_guidelines_list = []
             active_version = None
             
-            for record in guidelines_records:
-                version = record.version
-                
-                if record.is_active and not active_version:
-                    active_version = version
+            for version, version_records in groupby(guidelines_records, key=attrgetter("version")):
+                categories = []
+                metadata = None
                 
-                if version not in guidelines_by_version:
-                    guidelines_by_version[version] = {
-                        'metadata': record,
-                        'categories': []
-                    }
+                for record in version_records:
+                    if metadata is None:
+                        metadata = record
+                    categories.append(self._category_from_record(record))
                 
-                # Convert database record to category
-                criteria_data = record.criteria
-                category = GuidelineCategory(
-                    section=record.section,
-                    name=criteria_data.get("name", record.section.replace("_", " ").title()),
-                    weight=record.weight,
-                    criteria=criteria_data.get("criteria", []),
-                    red_flags=criteria_data.get("red_flags", []),
-                    scoring_guide=criteria_data.get("scoring_guide", {
-                        "1-3": "Low score",
-                        "4-5": "Below average", 
-                        "6-7": "Above average",
-                        "8-10": "High score"
-                    })
-                )
+                if metadata.is_active and active_version is None:
+                    active_version = version
                 
-                guidelines_by_version[version]['categories'].append(category)
-            
-            # Convert to SavedGuidelines format
-            saved_guidelines_list = []
-            for version, data in guidelines_by_version.items():
-                metadata = data['metadata']
-                guidelines = GeneratedGuidelines(categories=data['categories'])
+                guidelines = GeneratedGuidelines.model_construct(categories=categories)
                 
-                saved_guidelines = SavedGuidelines(
+                saved_guidelines = SavedGuidelines.model_construct(
                     id=metadata.id,
                     program_id=program_id,
                     guidelines=guidelines,
@@ -313,6 +304,13 @@ class AIGuidelinesService:
                 
                 saved_guidelines_list.append(saved_guidelines)
             
+            if not saved_guidelines_list and not self._owns_program(db, program_id, organization_id):
+                return GuidelinesListResponse(
+                    success=False,
+                    guidelines=[],
+                    error="Program not found or access denied"
+                )
+            
             return GuidelinesListResponse(
                 success=True,
                 guidelines=saved_guidelines_list,
@@ -345,42 +343,37 @@ class AIGuidelinesService:
             SavedGuidelines if found, None otherwise
         """
         try:
-            # Verify program belongs to organization
-            program = db.query(Program).filter(
-                Program.id == program_id,
-                Program.organization_id == organization_id
-            ).first()
-            
-            if not program:
-                return None
-            
-            # Get active guidelines
-            active_records = db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id,
+            # Get active version metadata without loading the criteria documents;
+            # no row means either no active version or no access to the program
+            first_record = db.query(
+                AIGuideline.id,
+                AIGuideline.version,
+                AIGuideline.created_at,
+                AIGuideline.updated_at
+            ).filter(
+                AIGuideline.program_id == self._program_scope(program_id, organization_id),
                 AIGuideline.is_active == True
-            ).order_by(AIGuideline.section).all()
+            ).order_by(AIGuideline.section).first()
             
-            if not active_records:
+            if not first_record:
                 return None
             
-            # Convert to response format
-            categories = []
-            for record in active_records:
-                criteria_data = record.criteria
-                category = GuidelineCategory(
-                    section=record.section,
-                    name=criteria_data.get("name", record.section.replace("_", " ").title()),
-                    weight=record.weight,
-                    criteria=criteria_data.get("criteria", []),
-                    red_flags=criteria_data.get("red_flags", []),
-                    scoring_guide=criteria_data.get("scoring_guide", {})
+            guidelines = self._get_cached_guidelines(program_id, first_record.version)
+            if guidelines is None:
+                active_records = db.query(AIGuideline).options(
+                    defer(AIGuideline.prompt_template)
+                ).filter(
+                    AIGuideline.program_id == program_id,
+                    AIGuideline.version == first_record.version
+                ).order_by(AIGuideline.section).all()
+                
+                # Convert to response format
+                guidelines = GeneratedGuidelines.model_construct(
+                    categories=[self._category_from_record(record) for record in active_records]
                 )
-                categories.append(category)
-            
-            guidelines = GeneratedGuidelines(categories=categories)
-            first_record = active_records[0]
+                self._cache_guidelines(program_id, first_record.version, guidelines)
             
-            return SavedGuidelines(
+            return SavedGuidelines.model_construct(
                 id=first_record.id,
                 program_id=program_id,
                 guidelines=guidelines,
@@ -415,42 +408,30 @@ class AIGuidelinesService:
             GuidelinesActivationResponse with result
         """
         try:
-            # Verify program belongs to organization
-            program = db.query(Program).filter(
-                Program.id == program_id,
-                Program.organization_id == organization_id
-            ).first()
-            
-            if not program:
-                return GuidelinesActivationResponse(
-                    success=False,
-                    error="Program not found or access denied"
-                )
-            
-            # Check if version exists
-            version_exists = db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id,
-                AIGuideline.version == version
-            ).first()
-            
-            if not version_exists:
+            # Deactivate the current version and activate the requested one in a single UPDATE
+            touched_versions = db.execute(
+                update(AIGuideline).where(
+                    AIGuideline.program_id == self._program_scope(program_id, organization_id),
+                    or_(AIGuideline.is_active == True, AIGuideline.version == version)
+                ).values(
+                    is_active=(AIGuideline.version == version)
+                ).returning(AIGuideline.version).execution_options(synchronize_session=False)
+            ).scalars().all()
+            
+            updated_count = touched_versions.count(version)
+            if not updated_count:
+                # Nothing matched the requested version; keep the current activation
+                db.rollback()
+                if not self._owns_program(db, program_id, organization_id):
+                    return GuidelinesActivationResponse(
+                        success=False,
+                        error="Program not found or access denied"
+                    )
                 return GuidelinesActivationResponse(
                     success=False,
                     error=f"Version {version} not found"
                 )
             
-            # Deactivate all existing guidelines
-            db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id,
-                AIGuideline.is_active == True
-            ).update({"is_active": False})
-            
-            # Activate the specified version
-            updated_count = db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id,
-                AIGuideline.version == version
-            ).update({"is_active": True})
-            
             db.commit()
             
             logger.info(f"Activated guidelines version {version} for program {program_id} ({updated_count} records)")
@@ -486,13 +467,18 @@ class AIGuidelinesService:
             GuidelinesStatusResponse with status information
         """
         try:
-            # Verify program belongs to organization
-            program = db.query(Program).filter(
-                Program.id == program_id,
-                Program.organization_id == organization_id
-            ).first()
+            # Get guidelines statistics in one aggregate
+            stats = db.execute(
+                select(
+                    func.count(func.distinct(AIGuideline.version)).label("total_versions"),
+                    func.max(case((AIGuideline.is_active == True, AIGuideline.version))).label("active_version")
+                ).where(
+                    AIGuideline.program_id == self._program_scope(program_id, organization_id)
+                )
+            ).one()
+            total_versions = stats.total_versions
             
-            if not program:
+            if not total_versions and not self._owns_program(db, program_id, organization_id):
                 return GuidelinesStatusResponse(
                     success=False,
                     has_active_guidelines=False,
@@ -506,24 +492,14 @@ class AIGuidelinesService:
                     error="Program not found or access denied"
                 )
             
-            # Get guidelines statistics
-            active_guideline = db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id,
-                AIGuideline.is_active == True
-            ).first()
-            
-            total_versions = db.query(AIGuideline.version).filter(
-                AIGuideline.program_id == program_id
-            ).distinct().count()
-            
             # Get cache stats
             cache_stats_dict = openrouter_service.get_cache_stats()
             cache_stats = GuidelinesCacheStats(**cache_stats_dict)
             
             return GuidelinesStatusResponse(
                 success=True,
-                has_active_guidelines=active_guideline is not None,
-                active_version=active_guideline.version if active_guideline else None,
+                has_active_guidelines=stats.active_version is not None,
+                active_version=stats.active_version,
                 total_versions=total_versions,
                 cache_stats=cache_stats
             )
@@ -542,6 +518,78 @@ class AIGuidelinesService:
                 ),
                 error=f"Failed to get status: {str(e)}"
             )
+    
+    def _category_from_record(self, record: AIGuideline) -> GuidelineCategory:
+        """
+        Convert a stored guideline row to a category without re-validation.
+        
+        Rows are written from validated GeneratedGuidelines, so the stored
+        criteria document is trusted here.
+        """
+        criteria_data = record.criteria
+        scoring_guide = criteria_data.get("scoring_guide") or DEFAULT_SCORING_GUIDE
+        return GuidelineCategory.model_construct(
+            section=record.section,
+            name=criteria_data.get("name", _humanize_section(record.section)),
+            weight=record.weight,
+            criteria=criteria_data.get("criteria", []),
+            red_flags=criteria_data.get("red_flags", []),
+            scoring_guide=ScoringGuide.model_construct(
+                range_1_3=scoring_guide.get("1-3", DEFAULT_SCORING_GUIDE["1-3"]),
+                range_4_5=scoring_guide.get("4-5", DEFAULT_SCORING_GUIDE["4-5"]),
+                range_6_7=scoring_guide.get("6-7", DEFAULT_SCORING_GUIDE["6-7"]),
+                range_8_10=scoring_guide.get("8-10", DEFAULT_SCORING_GUIDE["8-10"])
+            )
+        )
+    
+    def _load_calibration_data(
+        self,
+        db: Session,
+        program_id: int,
+        organization_id: int
+    ) -> Optional[Dict[str, Any]]:
+        """Load calibration answers keyed by question; None if the program is not accessible."""
+        # Only the key/value pairs are needed, so skip ORM instances entirely
+        calibration_data = dict(db.execute(
+            select(CalibrationAnswer.question_key, CalibrationAnswer.answer_value).where(
+                CalibrationAnswer.program_id == self._program_scope(program_id, organization_id)
+            )
+        ).all())
+        
+        if not calibration_data and not self._owns_program(db, program_id, organization_id):
+            return None
+        
+        return calibration_data
+    
+    def _program_scope(self, program_id: int, organization_id: int):
+        """Scalar subquery yielding program_id only if the program belongs to the organization."""
+        return select(Program.id).where(
+            Program.id == program_id,
+            Program.organization_id == organization_id
+        ).scalar_subquery()
+    
+    def _owns_program(self, db: Session, program_id: int, organization_id: int) -> bool:
+        """Check program ownership; used only to explain an empty scoped result."""
+        return db.query(exists().where(
+            Program.id == program_id,
+            Program.organization_id == organization_id
+        )).scalar()
+    
+    def _get_cached_guidelines(self, program_id: int, version: int) -> Optional[GeneratedGuidelines]:
+        """Return parsed guidelines for a saved version if cached."""
+        with self._guidelines_cache_lock:
+            guidelines = self._guidelines_cache.get((program_id, version))
+            if guidelines is not None:
+                self._guidelines_cache.move_to_end((program_id, version))
+        return guidelines
+    
+    def _cache_guidelines(self, program_id: int, version: int, guidelines: GeneratedGuidelines) -> None:
+        """Cache parsed guidelines for a saved version, evicting the least recently used."""
+        with self._guidelines_cache_lock:
+            self._guidelines_cache[(program_id, version)] = guidelines
+            self._guidelines_cache.move_to_end((program_id, version))
+            if len(self._guidelines_cache) > GUIDELINES_CACHE_SIZE:
+                self._guidelines_cache.popitem(last=False)
 
 # Global service instance
 ai_guidelines_service = AIGuidelinesService()
\ No newline at end of file
@@ -1,6 +1,8 @@
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import and_, func, lambda_stmt, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 from ..models.calibration_answer import CalibrationAnswer
 from ..schemas.calibration import (
@@ -11,8 +13,10 @@ from ..schemas.calibration import (
     CalibrationQuestionsResponse
 )
 from ..core.calibration_questions import (
+    ALL_QUESTION_KEYS,
     CALIBRATION_QUESTIONS, 
     CALIBRATION_CATEGORIES,
+    VALID_CHOICES_BY_KEY,
     get_all_questions_organized,
     get_question_by_key
 )
@@ -35,44 +39,39 @@ class CalibrationService:
     
     def get_program_calibration_answers(self, program_id: int) -> List[CalibrationAnswerResponse]:
         """Get all calibration answers for a program"""
-        answers = (
-            self.db.query(CalibrationAnswer)
-            .filter(CalibrationAnswer.program_id == program_id)
-            .all()
-        )
+        # Only the response columns are needed, so skip ORM hydration
+        # lambda_stmt caches the statement construction, not just its compiled SQL
+        answers = self.db.execute(lambda_stmt(
+            lambda: select(
+                CalibrationAnswer.id,
+                CalibrationAnswer.question_key,
+                CalibrationAnswer.answer_value,
+                CalibrationAnswer.answer_text,
+                CalibrationAnswer.program_id,
+                CalibrationAnswer.created_at,
+                CalibrationAnswer.updated_at
+            ).where(CalibrationAnswer.program_id == program_id)
+        )).all()
         
         # Only return answers for questions that are currently defined
-        all_question_keys = {question["key"] for question in CALIBRATION_QUESTIONS}
-        valid_answers = [answer for answer in answers if answer.question_key in all_question_keys]
-        
         return [
-            CalibrationAnswerResponse(
-                id=answer.id,
-                question_key=answer.question_key,
-                answer_value=answer.answer_value,
-                answer_text=answer.answer_text,
-                program_id=answer.program_id,
-                created_at=answer.created_at.isoformat(),
-                updated_at=answer.updated_at.isoformat()
-            )
-            for answer in valid_answers
+            CalibrationAnswerResponse.model_validate(answer)
+            for answer in answers
+            if answer.question_key in ALL_QUESTION_KEYS
         ]
     
     def get_completion_status(self, program_id: int) -> CalibrationCompletionStatus:
         """Get calibration completion status for a program"""
-        existing_answers = (
-            self.db.query(CalibrationAnswer.question_key)
-            .filter(CalibrationAnswer.program_id == program_id)
-            .all()
-        )
+        existing_keys = self.db.scalars(lambda_stmt(
+            lambda: select(CalibrationAnswer.question_key).where(CalibrationAnswer.program_id == program_id)
+        )).all()
         
         # Only count answers for questions that are currently defined
-        all_question_keys = {question["key"] for question in CALIBRATION_QUESTIONS}
-        answered_keys = {answer.question_key for answer in existing_answers if answer.question_key in all_question_keys}
-        missing_keys = list(all_question_keys - answered_keys)
+        answered_keys = ALL_QUESTION_KEYS.intersection(existing_keys)
+        missing_keys = list(ALL_QUESTION_KEYS - answered_keys)
         
         answered_count = len(answered_keys)
-        total_count = len(all_question_keys)
+        total_count = len(ALL_QUESTION_KEYS)
         completion_percentage = (answered_count / total_count) * 100 if total_count > 0 else 0
         is_complete = len(missing_keys) == 0
         
@@ -100,55 +99,8 @@ class CalibrationService:
         answer_data: CalibrationAnswerCreate
     ) -> CalibrationAnswerResponse:
         """Create or update a calibration answer"""
-        
-        # Validate question key exists
-        question = get_question_by_key(answer_data.question_key)
-        if not question:
-            raise ValueError(f"Invalid question key: {answer_data.question_key}")
-        
-        # Validate answer format based on question type
-        self._validate_answer_format(question, answer_data.answer_value)
-        
-        # Check if answer already exists
-        existing_answer = (
-            self.db.query(CalibrationAnswer)
-            .filter(
-                and_(
-                    CalibrationAnswer.program_id == program_id,
-                    CalibrationAnswer.question_key == answer_data.question_key
-                )
-            )
-            .first()
-        )
-        
-        if existing_answer:
-            # Update existing answer
-            existing_answer.answer_value = answer_data.answer_value
-            existing_answer.answer_text = answer_data.answer_text
-            self.db.commit()
-            self.db.refresh(existing_answer)
-            answer = existing_answer
-        else:
-            # Create new answer
-            answer = CalibrationAnswer(
-                program_id=program_id,
-                question_key=answer_data.question_key,
-                answer_value=answer_data.answer_value,
-                answer_text=answer_data.answer_text
-            )
-            self.db.add(answer)
-            self.db.commit()
-            self.db.refresh(answer)
-        
-        return CalibrationAnswerResponse(
-            id=answer.id,
-            question_key=answer.question_key,
-            answer_value=answer.answer_value,
-            answer_text=answer.answer_text,
-            program_id=answer.program_id,
-            created_at=answer.created_at.isoformat(),
-            updated_at=answer.updated_at.isoformat()
-        )
+        self._validate_answer(answer_data)
+        return self._upsert_answers(program_id, [answer_data])[0]
     
     def batch_create_or_update_answers(
         self, 
@@ -156,17 +108,58 @@ class CalibrationService:
         answers_data: List[CalibrationAnswerCreate]
     ) -> List[CalibrationAnswerResponse]:
         """Create or update multiple calibration answers in batch"""
-        responses = []
-        
+        # Validate everything up front so a bad answer never leaves a partial batch
         for answer_data in answers_data:
             try:
-                response = self.create_or_update_answer(program_id, answer_data)
-                responses.append(response)
-            except Exception as e:
-                # For batch operations, you might want to handle partial failures
-                # For now, we'll let the error bubble up
+                self._validate_answer(answer_data)
+            except ValueError as e:
                 raise ValueError(f"Error processing answer for {answer_data.question_key}: {str(e)}")
         
+        return self._upsert_answers(program_id, answers_data)
+    
+    def _validate_answer(self, answer_data: CalibrationAnswerCreate) -> None:
+        """Validate the question key exists and the answer matches its type"""
+        question = get_question_by_key(answer_data.question_key)
+        if not question:
+            raise ValueError(f"Invalid question key: {answer_data.question_key}")
+        
+        self._validate_answer_format(question, answer_data.answer_value)
+    
+    def _upsert_answers(
+        self,
+        program_id: int,
+        answers_data: List[CalibrationAnswerCreate]
+    ) -> List[CalibrationAnswerResponse]:
+        """
+        Insert or update answers with one INSERT ... ON CONFLICT DO UPDATE ... RETURNING.
+        
+        Relies on the unique (program_id, question_key) index, so existing answers are
+        never selected first and the whole batch commits in a single round trip.
+        """
+        insert = pg_insert if self.db.get_bind().dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(CalibrationAnswer).values([
+            {
+                "program_id": program_id,
+                "question_key": answer_data.question_key,
+                "answer_value": answer_data.answer_value,
+                "answer_text": answer_data.answer_text
+            }
+            for answer_data in answers_data
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[CalibrationAnswer.program_id, CalibrationAnswer.question_key],
+            set_={
+                "answer_value": stmt.excluded.answer_value,
+                "answer_text": stmt.excluded.answer_text,
+                "updated_at": func.now()
+            }
+        ).returning(CalibrationAnswer)
+        
+        answers = self.db.scalars(stmt, execution_options={"populate_existing": True}).all()
+        # Build responses from the RETURNING rows before commit expires them
+        responses = [CalibrationAnswerResponse.model_validate(answer) for answer in answers]
+        self.db.commit()
+        
         return responses
     
     def delete_answer(self, program_id: int, question_key: str) -> bool:
@@ -191,41 +184,56 @@ class CalibrationService:
     
     def _validate_answer_format(self, question: Dict[str, Any], answer_value: Dict[str, Any]) -> None:
         """Validate answer format matches question type"""
-        question_type = question["type"]
-        
-        if question_type == "scale":
-            if "scale_value" not in answer_value:
-                raise ValueError("Scale questions require 'scale_value' in answer")
-            
-            scale_value = answer_value["scale_value"]
-            if not isinstance(scale_value, int):
-                raise ValueError("Scale value must be an integer")
-            
-            min_val = question.get("scale_min", 1)
-            max_val = question.get("scale_max", 10)
-            if not (min_val <= scale_value <= max_val):
-                raise ValueError(f"Scale value must be between {min_val} and {max_val}")
-        
-        elif question_type == "multiple_choice":
-            if "choice_value" not in answer_value:
-                raise ValueError("Multiple choice questions require 'choice_value' in answer")
-            
-            choice_value = answer_value["choice_value"]
+        validator = self._ANSWER_VALIDATORS.get(question["type"])
+        if validator:
+            validator(question, answer_value)
+    
+    @staticmethod
+    def _validate_scale_answer(question: Dict[str, Any], answer_value: Dict[str, Any]) -> None:
+        """Validate a scale answer is an integer within the question's range"""
+        if "scale_value" not in answer_value:
+            raise ValueError("Scale questions require 'scale_value' in answer")
+        
+        scale_value = answer_value["scale_value"]
+        if not isinstance(scale_value, int):
+            raise ValueError("Scale value must be an integer")
+        
+        min_val = question.get("scale_min", 1)
+        max_val = question.get("scale_max", 10)
+        if not (min_val <= scale_value <= max_val):
+            raise ValueError(f"Scale value must be between {min_val} and {max_val}")
+    
+    @staticmethod
+    def _validate_choice_answer(question: Dict[str, Any], answer_value: Dict[str, Any]) -> None:
+        """Validate a multiple choice answer is one of the question's options"""
+        if "choice_value" not in answer_value:
+            raise ValueError("Multiple choice questions require 'choice_value' in answer")
+        
+        choice_value = answer_value["choice_value"]
+        if choice_value not in VALID_CHOICES_BY_KEY[question["key"]]:
             valid_choices = [option["value"] for option in question.get("options", [])]
-            if choice_value not in valid_choices:
-                raise ValueError(f"Invalid choice. Valid options: {valid_choices}")
-        
-        elif question_type == "text":
-            if "text_value" not in answer_value:
-                raise ValueError("Text questions require 'text_value' in answer")
-            
-            text_value = answer_value["text_value"]
-            if not isinstance(text_value, str):
-                raise ValueError("Text value must be a string")
-            
-            max_length = question.get("max_length")
-            if max_length and len(text_value) > max_length:
-                raise ValueError(f"Text value exceeds maximum length of {max_length}")
+            raise ValueError(f"Invalid choice. Valid options: {valid_choices}")
+    
+    @staticmethod
+    def _validate_text_answer(question: Dict[str, Any], answer_value: Dict[str, Any]) -> None:
+        """Validate a text answer is a string within the question's max length"""
+        if "text_value" not in answer_value:
+            raise ValueError("Text questions require 'text_value' in answer")
+        
+        text_value = answer_value["text_value"]
+        if not isinstance(text_value, str):
+            raise ValueError("Text value must be a string")
+        
+        max_length = question.get("max_length")
+        if max_length and len(text_value) > max_length:
+            raise ValueError(f"Text value exceeds maximum length of {max_length}")
+    
+    # Question type -> answer validator; unknown types are accepted as-is
+    _ANSWER_VALIDATORS = {
+        "scale": _validate_scale_answer,
+        "multiple_choice": _validate_choice_answer,
+        "text": _validate_text_answer
+    }
     
     def get_answer_by_question_key(self, program_id: int, question_key: str) -> Optional[CalibrationAnswerResponse]:
         """Get a specific calibration answer by question key"""
@@ -243,12 +251,4 @@ class CalibrationService:
         if not answer:
             return None
         
-        return CalibrationAnswerResponse(
-            id=answer.id,
-            question_key=answer.question_key,
-            answer_value=answer.answer_value,
-            answer_text=answer.answer_text,
-            program_id=answer.program_id,
-            created_at=answer.created_at.isoformat(),
-            updated_at=answer.updated_at.isoformat()
-        )
\ No newline at end of file
+        return CalibrationAnswerResponse.model_validate(answer)
\ No newline at end of file
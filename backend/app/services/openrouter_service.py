@@ -3,9 +3,9 @@ OpenRouter API service for AI-powered guidelines generation.
 Provides secure integration with OpenRouter API using developer-configurable models.
 """
 
-import json
 import logging
 import hashlib
+import orjson
 from typing import Dict, Any, Optional, List
 import asyncio
 import httpx
@@ -34,6 +34,11 @@ class OpenRouterService:
     MAX_TOKENS = 2000
     REQUEST_TIMEOUT = 30.0
     
+    # Shared connection pool limits
+    MAX_CONNECTIONS = 100
+    MAX_KEEPALIVE_CONNECTIONS = 20
+    KEEPALIVE_EXPIRY = 30.0
+    
     def __init__(self):
         """Initialize OpenRouter service."""
         self.base_url = "https://openrouter.ai/api/v1"
@@ -44,13 +49,39 @@ class OpenRouterService:
         self._cache: Dict[str, Dict[str, Any]] = {}
         self._cache_ttl = timedelta(hours=24)
         
+        # Created on first use and reused so requests share pooled TLS connections
+        self._client: Optional[httpx.AsyncClient] = None
+        
         if not self.api_key:
             logger.warning("OPENROUTER_API_KEY not configured")
     
+    def _get_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            # HTTP/2 multiplexes concurrent generations over one connection
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=True,
+                headers=self._get_headers(),
+                timeout=self.REQUEST_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.MAX_CONNECTIONS,
+                    max_keepalive_connections=self.MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=self.KEEPALIVE_EXPIRY
+                )
+            )
+        return self._client
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client and its pooled connections."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
     def _get_cache_key(self, calibration_data: Dict[str, Any], model: str) -> str:
         """Generate cache key from calibration data and model."""
-        cache_content = json.dumps(calibration_data, sort_keys=True) + model
-        return hashlib.md5(cache_content.encode()).hexdigest()
+        cache_content = orjson.dumps(calibration_data, option=orjson.OPT_SORT_KEYS) + model.encode()
+        return hashlib.blake2b(cache_content, digest_size=16).hexdigest()
     
     def _is_cache_valid(self, cache_entry: Dict[str, Any]) -> bool:
         """Check if cache entry is still valid."""
@@ -191,62 +222,54 @@ Adjust weights based on accelerator preferences - higher weights for categories
             "temperature": 0.1  # Low temperature for consistent output
         }
         
-        headers = self._get_headers()
-        
         try:
             logger.info(f"Generating guidelines using model: {openrouter_model}")
             
-            async with httpx.AsyncClient() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload,
-                    timeout=self.REQUEST_TIMEOUT
-                )
-                
-                if response.status_code != 200:
-                    error_msg = f"OpenRouter API error: {response.status_code} - {response.text}"
-                    logger.error(error_msg)
-                    raise Exception(error_msg)
-                
-                response_data = response.json()
-                
-                # Extract content from response
-                content = response_data.get("choices", [{}])[0].get("message", {}).get("content", "")
-                
-                if not content:
-                    raise Exception("Empty response from OpenRouter API")
-                
-                # Parse JSON response
-                try:
-                    guidelines = json.loads(content)
-                except json.JSONDecodeError:
-                    # Try to extract JSON from response if wrapped in markdown
-                    import re
-                    json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+            response = await self._get_client().post("/chat/completions", json=payload)
+            
+            if response.status_code != 200:
+                error_msg = f"OpenRouter API error: {response.status_code} - {response.text}"
+                logger.error(error_msg)
+                raise Exception(error_msg)
+            
+            response_data = response.json()
+            
+            # Extract content from response
+            content = response_data.get("choices", [{}])[0].get("message", {}).get("content", "")
+            
+            if not content:
+                raise Exception("Empty response from OpenRouter API")
+            
+            # Parse JSON response
+            try:
+                guidelines = orjson.loads(content)
+            except orjson.JSONDecodeError:
+                # Try to extract JSON from response if wrapped in markdown
+                import re
+                json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', content, re.DOTALL)
+                if json_match:
+                    guidelines = orjson.loads(json_match.group(1))
+                else:
+                    # Attempt to find JSON object in text
+                    json_match = re.search(r'\{.*\}', content, re.DOTALL)
                     if json_match:
-                        guidelines = json.loads(json_match.group(1))
+                        guidelines = orjson.loads(json_match.group(0))
                     else:
-                        # Attempt to find JSON object in text
-                        json_match = re.search(r'\{.*\}', content, re.DOTALL)
-                        if json_match:
-                            guidelines = json.loads(json_match.group(0))
-                        else:
-                            raise Exception(f"Invalid JSON response: {content[:200]}...")
-                
-                # Validate response structure
-                if not isinstance(guidelines, dict) or "categories" not in guidelines:
-                    raise Exception("Invalid guidelines structure - missing 'categories' key")
-                
-                # Cache successful result
-                self._cache[cache_key] = {
-                    "guidelines": guidelines,
-                    "cached_at": datetime.now().isoformat()
-                }
-                
-                logger.info(f"Generated guidelines with {len(guidelines.get('categories', []))} categories")
-                return guidelines
-                
+                        raise Exception(f"Invalid JSON response: {content[:200]}...")
+            
+            # Validate response structure
+            if not isinstance(guidelines, dict) or "categories" not in guidelines:
+                raise Exception("Invalid guidelines structure - missing 'categories' key")
+            
+            # Cache successful result
+            self._cache[cache_key] = {
+                "guidelines": guidelines,
+                "cached_at": datetime.now().isoformat()
+            }
+            
+            logger.info(f"Generated guidelines with {len(guidelines.get('categories', []))} categories")
+            return guidelines
+            
         except httpx.TimeoutException:
             error_msg = f"OpenRouter API timeout after {self.REQUEST_TIMEOUT}s"
             logger.error(error_msg)
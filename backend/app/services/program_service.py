@@ -6,7 +6,7 @@ Handles CRUD operations, statistics, and program-related business rules.
 import logging
 from typing import List, Optional, Dict, Any
 from sqlalchemy.orm import Session
-from sqlalchemy import func, desc
+from sqlalchemy import func, desc, exists, select
 
 from app.models.program import Program
 from app.models.questionnaire import Questionnaire
@@ -67,16 +67,19 @@ class ProgramService:
                 organization_id=organization_id
             )
             
+            # The INSERT's RETURNING fills id and timestamps on flush, so the
+            # response is built before commit expires the instance (no refresh SELECT)
             db.add(program)
+            db.flush()
+            response = ProgramResponse(
+                success=True,
+                program=ProgramSchema.from_row(program)
+            )
             db.commit()
-            db.refresh(program)
             
-            logger.info(f"Created program '{program.name}' for organization {organization_id}")
+            logger.info(f"Created program '{program_data.name}' for organization {organization_id}")
             
-            return ProgramResponse(
-                success=True,
-                program=ProgramSchema.from_orm(program)
-            )
+            return response
             
         except Exception as e:
             db.rollback()
@@ -104,36 +107,22 @@ class ProgramService:
             ProgramListResponse with programs and stats
         """
         try:
-            # Base query
-            query = db.query(Program).filter(Program.organization_id == organization_id)
+            # Base query, with statistics computed per row in the same statement
+            query = db.query(Program, *self._statistics_columns()).filter(
+                Program.organization_id == organization_id
+            )
             
             if not include_inactive:
                 query = query.filter(Program.is_active == True)
             
-            programs = query.order_by(desc(Program.updated_at)).all()
+            rows = query.order_by(desc(Program.updated_at)).all()
             
-            # Get statistics for each program
-            programs_with_stats = []
-            for program in programs:
-                stats = self._get_program_statistics(db, program.id)
-                
-                program_with_stats = ProgramWithStats(
-                    id=program.id,
-                    name=program.name,
-                    description=program.description,
-                    is_active=program.is_active,
-                    organization_id=program.organization_id,
-                    created_at=program.created_at,
-                    updated_at=program.updated_at,
-                    questionnaire_count=stats['questionnaire_count'],
-                    calibration_completion=stats['calibration_completion'],
-                    has_active_guidelines=stats['has_active_guidelines'],
-                    application_count=stats['application_count']
-                )
-                
-                programs_with_stats.append(program_with_stats)
+            programs_with_stats = [
+                ProgramWithStats.from_row(row.Program, **self._statistics_from_row(row))
+                for row in rows
+            ]
             
-            return ProgramListResponse(
+            return ProgramListResponse.model_construct(
                 success=True,
                 programs=programs_with_stats,
                 total_count=len(programs_with_stats)
@@ -180,19 +169,7 @@ class ProgramService:
             # Get detailed statistics
             stats = self._get_program_statistics(db, program_id)
             
-            program_with_stats = ProgramWithStats(
-                id=program.id,
-                name=program.name,
-                description=program.description,
-                is_active=program.is_active,
-                organization_id=program.organization_id,
-                created_at=program.created_at,
-                updated_at=program.updated_at,
-                questionnaire_count=stats['questionnaire_count'],
-                calibration_completion=stats['calibration_completion'],
-                has_active_guidelines=stats['has_active_guidelines'],
-                application_count=stats['application_count']
-            )
+            program_with_stats = ProgramWithStats.from_row(program, **stats)
             
             return ProgramDetailsResponse(
                 success=True,
@@ -253,7 +230,7 @@ class ProgramService:
                     )
             
             # Update fields
-            update_data = program_data.dict(exclude_unset=True)
+            update_data = program_data.model_dump(exclude_unset=True)
             for field, value in update_data.items():
                 setattr(program, field, value)
             
@@ -264,7 +241,7 @@ class ProgramService:
             
             return ProgramResponse(
                 success=True,
-                program=ProgramSchema.from_orm(program)
+                program=ProgramSchema.from_row(program)
             )
             
         except Exception as e:
@@ -330,39 +307,45 @@ class ProgramService:
                 error=f"Failed to delete program: {str(e)}"
             )
     
+    def _statistics_columns(self) -> List[Any]:
+        """Correlated subqueries computing program statistics alongside each Program row."""
+        def count_for(model):
+            return (
+                select(func.count())
+                .select_from(model)
+                .where(model.program_id == Program.id)
+                .correlate(Program)
+                .scalar_subquery()
+            )
+        
+        return [
+            count_for(Questionnaire).label('questionnaire_count'),
+            count_for(CalibrationAnswer).label('calibration_answers_count'),
+            exists().where(
+                AIGuideline.program_id == Program.id,
+                AIGuideline.is_active == True
+            ).correlate(Program).label('has_active_guidelines'),
+            count_for(Application).label('application_count')
+        ]
+    
+    def _statistics_from_row(self, row: Any) -> Dict[str, Any]:
+        """Build the statistics dict from a row carrying the statistics columns."""
+        return {
+            'questionnaire_count': row.questionnaire_count,
+            # Rough calibration completion percentage (assume 8 total questions)
+            'calibration_completion': min(100.0, (row.calibration_answers_count / 8.0) * 100.0),
+            'has_active_guidelines': bool(row.has_active_guidelines),
+            'application_count': row.application_count
+        }
+    
     def _get_program_statistics(self, db: Session, program_id: int) -> Dict[str, Any]:
         """Get statistics for a program."""
         try:
-            # Questionnaire count
-            questionnaire_count = db.query(Questionnaire).filter(
-                Questionnaire.program_id == program_id
-            ).count()
-            
-            # Calibration completion (simplified - check if any answers exist)
-            calibration_answers_count = db.query(CalibrationAnswer).filter(
-                CalibrationAnswer.program_id == program_id
-            ).count()
+            row = db.query(*self._statistics_columns()).select_from(Program).filter(
+                Program.id == program_id
+            ).one()
             
-            # Rough calibration completion percentage (assume 8 total questions)
-            calibration_completion = min(100.0, (calibration_answers_count / 8.0) * 100.0)
-            
-            # Active guidelines check
-            has_active_guidelines = db.query(AIGuideline).filter(
-                AIGuideline.program_id == program_id,
-                AIGuideline.is_active == True
-            ).first() is not None
-            
-            # Application count  
-            application_count = db.query(Application).filter(
-                Application.program_id == program_id
-            ).count()
-            
-            return {
-                'questionnaire_count': questionnaire_count,
-                'calibration_completion': calibration_completion,
-                'has_active_guidelines': has_active_guidelines,
-                'application_count': application_count
-            }
+            return self._statistics_from_row(row)
             
         except Exception as e:
             logger.error(f"Failed to get statistics for program {program_id}: {str(e)}")
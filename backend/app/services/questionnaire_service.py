@@ -1,6 +1,6 @@
-from typing import List, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from typing import List, Optional, Tuple
+from sqlalchemy.orm import Session, lazyload
+from sqlalchemy import func, select
 
 from app.models.questionnaire import Questionnaire
 from app.models.question import Question
@@ -30,6 +30,37 @@ class QuestionnaireService:
             
         return query.order_by(Questionnaire.created_at.desc()).all()
     
+    @staticmethod
+    def get_questionnaires_with_question_counts(
+        db: Session,
+        program_id: int,
+        organization_id: int,
+        include_inactive: bool = False
+    ) -> List[Tuple[Questionnaire, int]]:
+        """Get all questionnaires for a program with their question counts computed in SQL"""
+        from app.models.program import Program
+        
+        question_count = (
+            select(func.count(Question.id))
+            .where(Question.questionnaire_id == Questionnaire.id)
+            .correlate(Questionnaire)
+            .scalar_subquery()
+            .label("question_count")
+        )
+        
+        # Only the count is needed, so skip the selectin load of each questionnaire's questions
+        query = db.query(Questionnaire, question_count).join(Program).options(
+            lazyload(Questionnaire.questions)
+        ).filter(
+            Questionnaire.program_id == program_id,
+            Program.organization_id == organization_id
+        )
+        
+        if not include_inactive:
+            query = query.filter(Questionnaire.is_active == True)
+            
+        return [tuple(row) for row in query.order_by(Questionnaire.created_at.desc()).all()]
+    
     @staticmethod
     def get_questionnaire_by_id(
         db: Session,
@@ -71,7 +102,7 @@ class QuestionnaireService:
         questionnaire_data: QuestionnaireUpdate
     ) -> Questionnaire:
         """Update an existing questionnaire"""
-        update_data = questionnaire_data.dict(exclude_unset=True)
+        update_data = questionnaire_data.model_dump(exclude_unset=True)
         
         for field, value in update_data.items():
             setattr(questionnaire, field, value)
@@ -102,10 +133,8 @@ class QuestionnaireService:
         )
         
         if questionnaire:
-            # Load questions
-            questions = db.query(Question).filter(
-                Question.questionnaire_id == questionnaire_id
-            ).order_by(Question.order_index).all()
+            # Questions are selectin-loaded with the questionnaire, ordered by order_index
+            questions = questionnaire.questions
             
             # Convert questions to dicts for JSON serialization
             questions_data = []
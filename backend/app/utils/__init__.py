@@ -1 +1,2 @@
-from .question_validators import QuestionValidators, QuestionTypeValidators, ValidationError
\ No newline at end of file
+from .question_validators import QuestionValidators, QuestionTypeValidators, ValidationError
+from .query_counter import count_queries
\ No newline at end of file
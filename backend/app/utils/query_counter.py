@@ -0,0 +1,25 @@
+from contextlib import contextmanager
+from typing import Iterator, List, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, Engine
+
+
+@contextmanager
+def count_queries(target: Union[Engine, Connection]) -> Iterator[List[str]]:
+    """
+    Record the SQL statements executed on an engine or connection.
+
+    Yields a list that collects each statement as it is sent to the database,
+    so tests can assert a constant query count and catch N+1 regressions.
+    """
+    statements: List[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(target, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", _record)
@@ -125,7 +125,7 @@ def create_test_application():
             print(f"✅ Using existing questionnaire: {questionnaire.name}")
         
         # Create a test application
-        unique_id = str(uuid.uuid4())
+        unique_id = uuid.uuid4()
         
         application = Application(
             unique_id=unique_id,
@@ -164,7 +164,7 @@ def create_test_application():
         
         return {
             "program_id": program.id,
-            "application_id": application.unique_id,
+            "application_id": str(application.unique_id),
             "public_url": public_url
         }
         
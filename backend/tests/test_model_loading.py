@@ -0,0 +1,118 @@
+"""
+Test default relationship loader strategies
+Run this with: python -m pytest backend/tests/test_model_loading.py -v
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.orm import sessionmaker, raiseload
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, load_all_models
+from app.models.organization import Organization
+from app.models.program import Program
+from app.models.questionnaire import Questionnaire
+from app.models.question import Question
+from app.models.application import Application
+from app.models.response import Response
+
+load_all_models()
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+Base.metadata.create_all(bind=engine)
+
+
+@pytest.fixture(scope="module")
+def questionnaire_id():
+    """Create a questionnaire with questions inserted out of order and one response"""
+    db = TestingSessionLocal()
+    org = Organization(name="Loader Org", email="loader@example.com", password_hash="hashed_password")
+    db.add(org)
+    db.flush()
+    program = Program(name="Loader Program", organization_id=org.id)
+    db.add(program)
+    db.flush()
+    questionnaire = Questionnaire(name="Loader Questionnaire", program_id=program.id)
+    db.add(questionnaire)
+    db.flush()
+    for order_index in (2, 0, 1):
+        db.add(Question(
+            questionnaire_id=questionnaire.id,
+            question_type="text",
+            text=f"Question {order_index}",
+            order_index=order_index
+        ))
+    db.flush()
+    application = Application(
+        startup_name="Loader Startup",
+        contact_email="startup@example.com",
+        program_id=program.id,
+        questionnaire_id=questionnaire.id
+    )
+    db.add(application)
+    db.flush()
+    db.add(Response(
+        application_id=application.id,
+        question_id=questionnaire.questions[0].id,
+        response_value={"value": "answer"}
+    ))
+    db.commit()
+    result = questionnaire.id
+    db.close()
+    return result
+
+
+def test_questions_are_eager_loaded_in_order(questionnaire_id):
+    """Questions are available on a detached questionnaire, ordered by order_index"""
+    db = TestingSessionLocal()
+    questionnaire = db.get(Questionnaire, questionnaire_id)
+    db.close()
+
+    assert [q.order_index for q in questionnaire.questions] == [0, 1, 2]
+
+
+def test_application_reads_do_not_lazy_load(questionnaire_id):
+    """Responses and their questions load without any lazy SQL on access"""
+    db = TestingSessionLocal()
+    application = (
+        db.query(Application)
+        .filter(Application.questionnaire_id == questionnaire_id)
+        .options(raiseload(Application.program), raiseload(Application.questionnaire))
+        .one()
+    )
+
+    assert all(r.application is application for r in application.responses)
+    db.close()
+
+    assert [r.question.text for r in application.responses] == ["Question 0"]
+    assert application.scores == []
+
+
+def test_unbounded_collections_raise(questionnaire_id):
+    """Collections that grow with usage must be loaded explicitly"""
+    db = TestingSessionLocal()
+    question = db.query(Question).filter(Question.questionnaire_id == questionnaire_id).first()
+    application = db.query(Application).filter(Application.questionnaire_id == questionnaire_id).one()
+
+    with pytest.raises(InvalidRequestError):
+        question.responses
+    with pytest.raises(InvalidRequestError):
+        application.reports
+    db.close()
+
+
+def test_child_to_parent_fetch_raises(questionnaire_id):
+    """Responses loaded on their own must not fetch their application lazily"""
+    db = TestingSessionLocal()
+    response = db.query(Response).first()
+
+    with pytest.raises(InvalidRequestError):
+        response.application
+    db.close()
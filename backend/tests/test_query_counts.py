@@ -0,0 +1,107 @@
+"""
+Guard service read/write paths against N+1 query regressions
+Run this with: python -m pytest backend/tests/test_query_counts.py -v
+"""
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from app.models import Base, load_all_models
+from app.models.organization import Organization
+from app.models.program import Program
+from app.schemas.ai_guidelines import GeneratedGuidelines
+from app.schemas.calibration import CalibrationAnswerCreate
+from app.services.ai_guidelines_service import ai_guidelines_service
+from app.services.calibration_service import CalibrationService
+from app.utils import count_queries
+
+load_all_models()
+
+engine = create_engine(
+    "sqlite://",
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+Base.metadata.create_all(bind=engine)
+
+
+def _guidelines(*sections):
+    """Build minimal generated guidelines with one category per section"""
+    return GeneratedGuidelines(categories=[
+        {
+            "section": section,
+            "name": section.title(),
+            "weight": 5,
+            "criteria": ["criterion"],
+            "red_flags": ["red flag"],
+            "scoring_guide": {"1-3": "low", "4-5": "fair", "6-7": "good", "8-10": "great"}
+        }
+        for section in sections
+    ])
+
+
+@pytest.fixture(scope="module")
+def program():
+    """Create an organization with one program"""
+    db = TestingSessionLocal()
+    org = Organization(name="Counter Org", email="counter@example.com", password_hash="hashed_password")
+    db.add(org)
+    db.flush()
+    program = Program(name="Counter Program", organization_id=org.id)
+    db.add(program)
+    db.commit()
+    result = (program.id, org.id)
+    db.close()
+    return result
+
+
+def test_batch_answers_upsert_in_one_statement(program):
+    """Saving a batch of calibration answers costs one statement regardless of size"""
+    program_id, _ = program
+    db = TestingSessionLocal()
+    answers = [
+        CalibrationAnswerCreate(question_key="risk_tolerance", answer_value={"scale_value": 5}),
+        CalibrationAnswerCreate(question_key="geographic_preference", answer_value={"text_value": "Anywhere"}),
+        CalibrationAnswerCreate(question_key="team_importance", answer_value={"scale_value": 8})
+    ]
+
+    with count_queries(engine) as statements:
+        saved = CalibrationService(db).batch_create_or_update_answers(program_id, answers)
+    db.close()
+
+    assert len(saved) == 3
+    assert len(statements) == 1
+
+
+def test_calibration_answers_read_in_one_statement(program):
+    """Listing calibration answers does not load anything per answer"""
+    program_id, _ = program
+    db = TestingSessionLocal()
+
+    with count_queries(engine) as statements:
+        answers = CalibrationService(db).get_program_calibration_answers(program_id)
+    db.close()
+
+    assert len(answers) == 3
+    assert len(statements) == 1
+
+
+def test_guidelines_history_read_in_one_statement(program):
+    """History stays a single query as versions and categories grow"""
+    program_id, organization_id = program
+    db = TestingSessionLocal()
+    for sections in (("team", "market"), ("team", "market", "traction")):
+        assert ai_guidelines_service.save_guidelines(
+            db, program_id, organization_id, _guidelines(*sections)
+        ).success
+
+    with count_queries(engine) as statements:
+        history = ai_guidelines_service.get_guidelines_history(db, program_id, organization_id)
+    db.close()
+
+    assert [saved.version for saved in history.guidelines] == [2, 1]
+    assert len(statements) == 1